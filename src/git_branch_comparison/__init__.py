@@ -9,10 +9,7 @@ __version__ = "1.0.0"
 __author__ = "Elias Rangel"
 __email__ = "elias.rangel@gmail.com"
 
-from .models import FileChange, BranchComparison
-from .analyzers import FileAnalyzerFactory
-from .git_comparator import GitComparator
-from .report_generator import ReportGenerator
+import importlib
 
 __all__ = [
     'FileChange',
@@ -20,4 +17,27 @@ __all__ = [
     'FileAnalyzerFactory',
     'GitComparator',
     'ReportGenerator',
-]
\ No newline at end of file
+]
+
+# Public names are imported on first access so that the CLI (and its
+# --help) does not pay for GitPython, PyYAML and nbformat up front
+_LAZY_IMPORTS = {
+    'FileChange': '.models',
+    'BranchComparison': '.models',
+    'FileAnalyzerFactory': '.analyzers',
+    'GitComparator': '.git_comparator',
+    'ReportGenerator': '.report_generator',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
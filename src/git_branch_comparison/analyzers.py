@@ -2,26 +2,106 @@
 File analyzers for different file types
 """
 
+import os
 import re
 import difflib
-from pathlib import Path
-from typing import Dict, List, Any
+import warnings
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from abc import ABC, abstractmethod
-import xml.etree.ElementTree as ET
 from xml.parsers.expat import ExpatError
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader
+    warnings.warn("PyYAML was built without libyaml; YAML files are parsed with the "
+                  "much slower pure-Python SafeLoader", ImportWarning)
+
+try:
+    from lxml import etree as ET
+    # resolve_entities='internal' (expand DTD entities, refuse external
+    # ones) needs lxml 5; older releases would resolve external entities too
+    if ET.LXML_VERSION < (5, 0):
+        raise ImportError("lxml 5.0 or later is required")
+    _HAS_LXML = True
+    _XML_PARSE_ERRORS = (ET.XMLSyntaxError,)
+except ImportError:  # Optional accelerator, see the 'fast' extra
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+    _XML_PARSE_ERRORS = (ET.ParseError, ExpatError)
+
 from .models import FileChange
 
 
+# Properties entry: the key runs to the first '=' of the line, or to the first
+# ':' when there is none, and the value continues over lines ending in '\'.
+# Blank and comment ('#', '!') lines never match; the lookbehinds keep
+# surrounding blanks out of keys and values
+_PROPERTY_RE = re.compile(
+    r'^[ \t]*(?:([^\s#!=][^=\n]*(?<![ \t]))[ \t]*=|([^\s#!=:][^=:\n]*(?<![ \t]))[ \t]*:)'
+    r'[ \t]*((?:[^\n]*\\\n)*[^\n]*(?<![ \t]))',
+    re.MULTILINE
+)
+
+# Files larger than this, or with a NUL byte in their first
+# BINARY_SNIFF_BYTES, are not analyzed (lockfiles, bundles, binaries)
+MAX_ANALYZE_BYTES = 1 << 20
+BINARY_SNIFF_BYTES = 8192
+
+# Line count difference above which moved blocks are not searched for
+MOVED_BLOCKS_MAX_LENGTH_DIFF = 10000
+
+# XML documents are fed to the pull parser in chunks of this many characters
+XML_FEED_CHUNK = 64 * 1024
+
+
+def _file_extension(file_path: str) -> str:
+    """Lower-cased extension of a path, same as ``Path(file_path).suffix.lower()``"""
+    # splitext skips building a Path and only differs on a trailing dot
+    ext = os.path.splitext(file_path)[1]
+    return '' if ext == '.' else ext.lower()
+
+
+def _iter_xml_events(text: str) -> Iterator[Tuple[str, Any]]:
+    """Stream (event, element) start/end pairs of an XML document
+    
+    Events are drained after every fed chunk, so the caller can discard
+    finished elements before the rest of the document is parsed.
+    """
+    if _HAS_LXML:
+        # Comments and PIs are dropped as ElementTree does, internal
+        # entities are expanded like expat does while external ones and
+        # network access are refused, and the text's own encoding
+        # declaration is overridden
+        parser = ET.XMLPullParser(events=('start', 'end'), encoding='utf-8',
+                                  remove_comments=True, remove_pis=True,
+                                  resolve_entities='internal', no_network=True)
+        data = text.encode('utf-8')
+    else:
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        data = text
+    
+    for offset in range(0, len(data), XML_FEED_CHUNK):
+        parser.feed(data[offset:offset + XML_FEED_CHUNK])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
 class BaseAnalyzer(ABC):
     """Base analyzer for generic file comparison"""
     
-    def analyze_differences(self, file_path: str, repo, merge_conflicts: bool = False) -> FileChange:
-        """Analyze differences in a file"""
+    def analyze_differences(self, file_path: str, repo, merge_conflicts: bool = False,
+                            read_blob: Optional[Callable[[str], Optional[bytes]]] = None) -> FileChange:
+        """Analyze differences in a file
+        
+        ``read_blob`` maps a path to its HEAD blob content (e.g. a
+        ``GitCatFileBatch`` reader); without it `git show` is used.
+        """
         change = FileChange(
             file_path=file_path,
-            file_type=Path(file_path).suffix.lower(),
+            file_type=_file_extension(file_path),
             analyzer_used=self.__class__.__name__,
             has_semantic_changes=True,  # Assume true for base analyzer
             has_conflicts=merge_conflicts
@@ -30,23 +110,48 @@ class BaseAnalyzer(ABC):
         try:
             # Get file content in different states
             if merge_conflicts:
-                change.conflict_content = self._read_file_content(file_path, repo.working_dir)
+                data = self._read_file_bytes(file_path, repo.working_dir, MAX_ANALYZE_BYTES)
+                skipped = self._skip_reason(data)
+                if skipped:
+                    # Nor are conflicts parsed or the content embedded
+                    change.detailed_analysis['skipped'] = skipped
+                    return change
+                
+                change.conflict_content = self._decode_content(data)
                 conflicts = self._parse_conflicts(change.conflict_content)
                 change.detailed_analysis['conflicts'] = conflicts
             else:
                 # Get content from HEAD and working tree
                 try:
-                    change.content_before = repo.git.show(f'HEAD:{file_path}')
+                    if read_blob is not None:
+                        data_before = read_blob(file_path) or b''
+                    else:
+                        data_before = repo.git.show(f'HEAD:{file_path}', stdout_as_string=False)
                 except:
-                    change.content_before = ""
+                    data_before = b''
                 
-                change.content_after = self._read_file_content(file_path, repo.working_dir)
+                data_after = self._read_file_bytes(file_path, repo.working_dir, MAX_ANALYZE_BYTES)
+                skipped = self._skip_reason(data_before) or self._skip_reason(data_after)
+                if skipped:
+                    # Left without contents; text diffs of these are meaningless
+                    change.detailed_analysis['skipped'] = skipped
+                    return change
+                
+                change.content_before = self._decode_content(data_before)
+                change.content_after = self._decode_content(data_after)
             
             # Perform base analysis
             self._analyze_whitespace_changes(change)
+            # One line matcher, and so one diff, for the line-based analyses,
+            # which skip identical contents and empty sides
+            matcher = None
+            if (change.content_before and change.content_after and
+                    change.content_before != change.content_after):
+                matcher = difflib.SequenceMatcher(None, (change.content_before or '').splitlines(),
+                                                  (change.content_after or '').splitlines())
             # TODO: Fix move block analysis
-            #self._analyze_moved_blocks(change)
-            self._calculate_summary(change)
+            #self._analyze_moved_blocks(change, matcher)
+            self._calculate_summary(change, matcher)
             
             # Let subclasses add their specific analysis
             self._format_specific_analysis(change)
@@ -58,31 +163,82 @@ class BaseAnalyzer(ABC):
     
     def _read_file_content(self, file_path: str, repo_working_dir: str = None) -> str:
         """Read file content safely"""
+        return self._decode_content(self._read_file_bytes(file_path, repo_working_dir))
+    
+    def _read_file_bytes(self, file_path: str, repo_working_dir: str = None,
+                         limit: Optional[int] = None) -> bytes:
+        """Read raw file content, at most one byte past ``limit`` if given"""
         # If we have a repo working directory, create absolute path
         if repo_working_dir:
-            abs_path = Path(repo_working_dir) / file_path
+            abs_path = os.path.join(repo_working_dir, file_path)
         else:
-            abs_path = Path(file_path)
+            abs_path = file_path
         
         try:
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            with open(abs_path, 'rb') as f:
+                return f.read() if limit is None else f.read(limit + 1)
+        except FileNotFoundError:
+            return b""  # Deleted by the merge
+    
+    def _skip_reason(self, data: bytes) -> Optional[str]:
+        """Why raw content should not be analyzed, if it should not"""
+        if len(data) > MAX_ANALYZE_BYTES:
+            return 'large'
+        if b'\0' in data[:BINARY_SNIFF_BYTES]:
+            return 'binary'
+        return None
+    
+    def _decode_content(self, data: bytes) -> str:
+        """Decode raw file content, falling back to Latin-1
+        
+        Line endings are normalized to ``\\n`` like text-mode reads of the
+        working tree, so both sides of a diff are directly comparable.
+        """
+        try:
+            text = data.decode('utf-8')
         except UnicodeDecodeError:
-            with open(abs_path, 'r', encoding='latin-1') as f:
-                return f.read()
+            text = data.decode('latin-1')
+        return text.replace('\r\n', '\n').replace('\r', '\n')
     
     def _parse_conflicts(self, content: str) -> List[Dict]:
-        """Parse git conflict markers"""
+        """Parse git conflict markers
+        
+        Each conflict is found by jumping from marker line to marker line
+        with str.find, so the scan is linear and either side may be empty;
+        offsets span from the opening marker to the end of the closing
+        marker line.
+        """
         conflicts = []
-        conflict_pattern = r'<<<<<<< .*?\n(.*?)\n=======\n(.*?)\n>>>>>>> .*?\n'
+        pos = 0
         
-        for match in re.finditer(conflict_pattern, content, re.DOTALL):
+        while True:
+            # Opening marker, only at the start of a line
+            start = content.find('<<<<<<< ', pos)
+            if start == -1:
+                break
+            if start and content[start - 1] != '\n':
+                pos = start + 1
+                continue
+            
+            # The newline ending each marker line may also start the next one
+            ours_start = content.find('\n', start) + 1
+            separator = content.find('\n=======\n', ours_start - 1) if ours_start else -1
+            if separator == -1:
+                break
+            theirs_start = separator + len('\n=======\n')
+            close = content.find('\n>>>>>>> ', theirs_start - 1)
+            if close == -1:
+                break
+            end = content.find('\n', close + 1)
+            end_pos = len(content) if end == -1 else end + 1
+            
             conflicts.append({
-                'ours': match.group(1),
-                'theirs': match.group(2),
-                'start_pos': match.start(),
-                'end_pos': match.end()
+                'ours': content[ours_start:max(separator, ours_start)],
+                'theirs': content[theirs_start:max(close, theirs_start)],
+                'start_pos': start,
+                'end_pos': end_pos
             })
+            pos = end_pos
         
         return conflicts
     
@@ -90,10 +246,17 @@ class BaseAnalyzer(ABC):
         """Detect whitespace-only changes"""
         if not change.content_before or not change.content_after:
             return
+        
+        # Identical contents trivially normalize to the same text
+        if change.content_before == change.content_after:
+            change.detailed_analysis['whitespace_only'] = True
+            change.has_semantic_changes = False
+            return
             
-        # Normalize whitespace
-        normalized_before = re.sub(r'\s+', ' ', change.content_before.strip())
-        normalized_after = re.sub(r'\s+', ' ', change.content_after.strip())
+        # Normalize whitespace; same result as collapsing \s+ runs of the
+        # stripped text, without going through the regex engine
+        normalized_before = ' '.join(change.content_before.split())
+        normalized_after = ' '.join(change.content_after.split())
         
         if normalized_before == normalized_after:
             change.detailed_analysis['whitespace_only'] = True
@@ -101,28 +264,31 @@ class BaseAnalyzer(ABC):
         else:
             change.detailed_analysis['whitespace_only'] = False
     
-    def _analyze_moved_blocks(self, change: FileChange):
+    def _analyze_moved_blocks(self, change: FileChange, matcher: Optional[difflib.SequenceMatcher] = None):
         """Detect moved code blocks"""
         if not change.content_before or not change.content_after:
             return
-            
-        lines_before = change.content_before.splitlines()
-        lines_after = change.content_after.splitlines()
+        
+        # Nothing can move between identical contents
+        if change.content_before == change.content_after:
+            return
         
         # Use sequence matcher to find moved blocks
-        matcher = difflib.SequenceMatcher(None, lines_before, lines_after)
+        if matcher is None:
+            matcher = difflib.SequenceMatcher(None, change.content_before.splitlines(),
+                                              change.content_after.splitlines())
+        # Mostly added or removed content; matching it is close to quadratic
+        if abs(len(matcher.a) - len(matcher.b)) > MOVED_BLOCKS_MAX_LENGTH_DIFF:
+            return
+        lines_before = matcher.a
         moved_blocks = []
         
         for tag, i1, i2, j1, j2 in matcher.get_opcodes():
             if tag == 'equal' and (i2 - i1) > 3:  # Block of at least 4 lines
-                # Check if this block appears elsewhere
-                block = lines_before[i1:i2]
-                block_str = '\n'.join(block)
-                
                 # Look for this block in different positions
                 if i1 != j1:  # Position changed
                     moved_blocks.append({
-                        'content': block_str[:100] + '...' if len(block_str) > 100 else block_str,
+                        'content': self._block_preview(lines_before, i1, i2),
                         'old_position': i1,
                         'new_position': j1,
                         'size': i2 - i1
@@ -131,23 +297,43 @@ class BaseAnalyzer(ABC):
         if moved_blocks:
             change.detailed_analysis['moved_blocks'] = moved_blocks
     
-    def _calculate_summary(self, change: FileChange):
+    def _block_preview(self, lines: List[str], start: int, end: int, limit: int = 100) -> str:
+        """First ``limit`` characters of the joined lines[start:end], with
+        '...' appended when truncated, without joining the whole block"""
+        preview = []
+        length = -1  # No separator before the first line
+        for index in range(start, end):
+            preview.append(lines[index])
+            length += len(lines[index]) + 1
+            if length > limit:
+                return '\n'.join(preview)[:limit] + '...'
+        return '\n'.join(preview)
+    
+    def _calculate_summary(self, change: FileChange, matcher: Optional[difflib.SequenceMatcher] = None):
         """Calculate change summary statistics"""
-        if not change.content_before or not change.content_after:
+        if not change.content_before and not change.content_after:
             return
-            
-        lines_before = change.content_before.splitlines()
-        lines_after = change.content_after.splitlines()
         
-        differ = difflib.unified_diff(lines_before, lines_after, lineterm='')
-        additions = 0
-        deletions = 0
+        if change.content_before == change.content_after:
+            change.summary = {'additions': 0, 'deletions': 0, 'total_changes': 0}
+            return
         
-        for line in differ:
-            if line.startswith('+') and not line.startswith('+++'):
-                additions += 1
-            elif line.startswith('-') and not line.startswith('---'):
-                deletions += 1
+        if not change.content_before or not change.content_after:
+            # Added or emptied file: every line of the other side changed
+            additions = len((change.content_after or '').splitlines())
+            deletions = len((change.content_before or '').splitlines())
+        else:
+            # Tally the diff opcodes directly rather than formatting a diff
+            if matcher is None:
+                matcher = difflib.SequenceMatcher(None, change.content_before.splitlines(),
+                                                  change.content_after.splitlines())
+            additions = 0
+            deletions = 0
+            
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag != 'equal':
+                    additions += j2 - j1
+                    deletions += i2 - i1
         
         change.summary = {
             'additions': additions,
@@ -169,12 +355,8 @@ class XMLAnalyzer(BaseAnalyzer):
             return
             
         try:
-            # Parse XML trees
-            tree_before = ET.fromstring(change.content_before)
-            tree_after = ET.fromstring(change.content_after)
-            
             # Compare structure
-            structure_changes = self._compare_xml_structure(tree_before, tree_after)
+            structure_changes = self._compare_xml_structure(change.content_before, change.content_after)
             change.format_specific.update(structure_changes)
             
             # If only formatting/order changed, not semantic
@@ -184,11 +366,11 @@ class XMLAnalyzer(BaseAnalyzer):
                 structure_changes['attribute_changes'] == 0):
                 change.has_semantic_changes = False
                 
-        except (ET.ParseError, ExpatError) as e:
+        except _XML_PARSE_ERRORS as e:
             change.format_specific['parse_error'] = str(e)
     
-    def _compare_xml_structure(self, tree1: ET.Element, tree2: ET.Element) -> Dict:
-        """Compare two XML trees structurally"""
+    def _compare_xml_structure(self, content1: str, content2: str) -> Dict:
+        """Compare two XML documents structurally"""
         stats = {
             'elements_added': 0,
             'elements_removed': 0,
@@ -199,45 +381,73 @@ class XMLAnalyzer(BaseAnalyzer):
             'namespace_changes': 0
         }
         
-        # Get all elements from both trees
-        elements1 = {self._element_signature(e): e for e in tree1.iter()}
-        elements2 = {self._element_signature(e): e for e in tree2.iter()}
+        # Get all elements from both documents
+        elements1 = self._collect_elements(content1)
+        elements2 = self._collect_elements(content2)
         
         # Find added/removed elements
-        added = set(elements2.keys()) - set(elements1.keys())
-        removed = set(elements1.keys()) - set(elements2.keys())
-        
-        stats['elements_added'] = len(added)
-        stats['elements_removed'] = len(removed)
+        stats['elements_added'] = len(elements2.keys() - elements1.keys())
+        stats['elements_removed'] = len(elements1.keys() - elements2.keys())
         
         # Check for reordering and attribute changes
-        for sig in set(elements1.keys()) & set(elements2.keys()):
-            elem1 = elements1[sig]
-            elem2 = elements2[sig]
+        for sig in elements1.keys() & elements2.keys():
+            names1, attrib1, text1 = elements1[sig]
+            names2, attrib2, text2 = elements2[sig]
             
             # Check attribute order
-            if (list(elem1.attrib.keys()) != list(elem2.attrib.keys()) and
-                set(elem1.attrib.keys()) == set(elem2.attrib.keys())):
+            if names1 != names2 and set(names1) == set(names2):
                 stats['attributes_reordered'] += 1
             
             # Check attribute values
-            for attr in elem1.attrib:
-                if elem1.attrib.get(attr) != elem2.attrib.get(attr, None):
+            for attr, value in attrib1.items():
+                if value != attrib2.get(attr):
                     stats['attribute_changes'] += 1
             
             # Check text content
-            text1 = (elem1.text or '').strip()
-            text2 = (elem2.text or '').strip()
             if text1 != text2:
                 stats['text_changes'] += 1
         
         return stats
     
-    def _element_signature(self, elem: ET.Element) -> str:
+    def _collect_elements(self, content: str) -> Dict[Tuple, Tuple[Tuple[str, ...], Dict[str, str], str]]:
+        """Map element signatures to (attribute names, attributes, stripped text)
+        
+        The document is streamed and each element cleared once recorded, so
+        only the path to the current element is kept in memory. Like a walk
+        of the full tree, the last element in document order wins when
+        signatures collide.
+        """
+        elements = {}
+        positions = {}
+        open_positions = []
+        position = 0
+        
+        for event, elem in _iter_xml_events(content):
+            if event == 'start':
+                open_positions.append(position)
+                position += 1
+                continue
+            
+            start = open_positions.pop()
+            sig = self._element_signature(elem)
+            if start > positions.get(sig, -1):
+                positions[sig] = start
+                attrib = dict(elem.attrib)
+                elements[sig] = (tuple(attrib), attrib, (elem.text or '').strip())
+            
+            elem.clear()
+            if _HAS_LXML:
+                # Also drop finished siblings still attached to the parent
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        
+        return elements
+    
+    def _element_signature(self, elem: ET.Element) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
         """Create a signature for an XML element for comparison"""
-        # Use tag name and attributes (sorted) as signature
-        attrs = ','.join(f"{k}={v}" for k, v in sorted(elem.attrib.items()))
-        return f"{elem.tag}[{attrs}]"
+        # Use tag name and attributes (sorted) as signature; a tuple hashes
+        # and compares without formatting a string per element
+        return elem.tag, tuple(sorted(elem.attrib.items()))
 
 
 class YAMLAnalyzer(BaseAnalyzer):
@@ -250,8 +460,8 @@ class YAMLAnalyzer(BaseAnalyzer):
             
         try:
             # Parse YAML documents
-            docs_before = list(yaml.safe_load_all(change.content_before))
-            docs_after = list(yaml.safe_load_all(change.content_after))
+            docs_before = list(yaml.load_all(change.content_before, Loader=_YAMLLoader))
+            docs_after = list(yaml.load_all(change.content_after, Loader=_YAMLLoader))
             
             # Compare documents
             yaml_changes = self._compare_yaml_documents(docs_before, docs_after)
@@ -287,22 +497,28 @@ class YAMLAnalyzer(BaseAnalyzer):
         return stats
     
     def _yaml_structures_equal(self, obj1: Any, obj2: Any) -> bool:
-        """Deep comparison of YAML structures"""
+        """Deep comparison of YAML structures
+        
+        The builtin ``==`` rejects differing structures in one C-level
+        pass; equal ones are then walked only to check that the values also
+        match type for type, which ``==`` ignores (``1 == 1.0 == True``).
+        """
+        if obj1 != obj2:
+            return False
+        return self._yaml_types_equal(obj1, obj2)
+    
+    def _yaml_types_equal(self, obj1: Any, obj2: Any) -> bool:
+        """Check that two ``==`` equal YAML structures have matching types"""
         if type(obj1) != type(obj2):
             return False
             
         if isinstance(obj1, dict):
-            if set(obj1.keys()) != set(obj2.keys()):
-                return False
-            return all(self._yaml_structures_equal(obj1[k], obj2[k]) for k in obj1)
+            return all(self._yaml_types_equal(value, obj2[key]) for key, value in obj1.items())
         
         elif isinstance(obj1, list):
-            if len(obj1) != len(obj2):
-                return False
-            return all(self._yaml_structures_equal(a, b) for a, b in zip(obj1, obj2))
+            return all(self._yaml_types_equal(a, b) for a, b in zip(obj1, obj2))
         
-        else:
-            return obj1 == obj2
+        return True
 
 
 class PropertiesAnalyzer(BaseAnalyzer):
@@ -329,63 +545,32 @@ class PropertiesAnalyzer(BaseAnalyzer):
     
     def _parse_properties(self, content: str) -> Dict[str, str]:
         """Parse properties file content"""
-        properties = {}
-        current_key = None
-        current_value = []
-        
-        for line in content.splitlines():
-            line = line.strip()
-            
-            # Skip comments and empty lines
-            if not line or line.startswith('#') or line.startswith('!'):
-                continue
-            
-            # Handle line continuation
-            if line.endswith('\\'):
-                if current_key:
-                    current_value.append(line[:-1])
-                continue
-            
-            # Parse key=value
-            if '=' in line or ':' in line:
-                if current_key:
-                    properties[current_key] = ''.join(current_value)
-                
-                # Split on first = or :
-                for sep in ['=', ':']:
-                    if sep in line:
-                        key, value = line.split(sep, 1)
-                        current_key = key.strip()
-                        current_value = [value.strip()]
-                        break
-            elif current_key:
-                current_value.append(line)
-        
-        # Don't forget the last property
-        if current_key:
-            properties[current_key] = ''.join(current_value)
-        
-        return properties
+        return {
+            key or colon_key: self._join_continued(value) if '\\\n' in value else value
+            for key, colon_key, value in _PROPERTY_RE.findall(content)
+        }
+    
+    def _join_continued(self, value: str) -> str:
+        """Join a value continued over several lines, dropping their indentation"""
+        return ''.join(part.lstrip() for part in value.split('\\\n'))
     
     def _compare_properties(self, props1: Dict, props2: Dict) -> Dict:
         """Compare two property dictionaries"""
-        keys1 = set(props1.keys())
-        keys2 = set(props2.keys())
+        # Key and item views support set operations directly, in C
+        keys1 = props1.keys()
+        keys2 = props2.keys()
+        common = len(keys1 & keys2)
         
         stats = {
-            'added_properties': len(keys2 - keys1),
-            'removed_properties': len(keys1 - keys2),
-            'value_changes': 0,
+            'added_properties': len(keys2) - common,
+            'removed_properties': len(keys1) - common,
+            # Common keys whose (key, value) item is not in both files
+            'value_changes': common - len(props1.items() & props2.items()),
             'reordered_properties': 0
         }
         
-        # Check for value changes
-        for key in keys1 & keys2:
-            if props1[key] != props2[key]:
-                stats['value_changes'] += 1
-        
         # If same properties but different order in file
-        if keys1 == keys2 and list(props1.keys()) != list(props2.keys()):
+        if keys1 == keys2 and list(keys1) != list(keys2):
             stats['reordered_properties'] = len(keys1)
         
         return stats
@@ -402,9 +587,15 @@ class FileAnalyzerFactory:
         '.props': PropertiesAnalyzer
     }
     
+    # Analyzers are stateless, so one shared instance per class is enough
+    _instances: Dict[type, BaseAnalyzer] = {}
+    
     @classmethod
     def get_analyzer(cls, file_path: str) -> BaseAnalyzer:
         """Get appropriate analyzer for file type"""
-        ext = Path(file_path).suffix.lower()
+        ext = _file_extension(file_path)
         analyzer_class = cls.analyzers.get(ext, BaseAnalyzer)
-        return analyzer_class()
\ No newline at end of file
+        analyzer = cls._instances.get(analyzer_class)
+        if analyzer is None:
+            analyzer = cls._instances.setdefault(analyzer_class, analyzer_class())
+        return analyzer
\ No newline at end of file
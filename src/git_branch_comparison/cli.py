@@ -9,15 +9,6 @@ import os
 from pathlib import Path
 from typing import List, Tuple
 
-# Set UTF-8 encoding for Windows console
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-
-from .git_comparator import GitComparator
-from .report_generator import ReportGenerator
-
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -75,6 +66,13 @@ Examples:
         help='Skip pulling latest changes from remote'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=0,
+        help='Number of comparisons to run in parallel (default: one per CPU)'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -90,17 +88,18 @@ def load_branch_pairs(config_file: str) -> List[Tuple[str, str]]:
     
     try:
         with open(config_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if ':' in line:
-                        from_branch, to_branch = line.split(':', 1)
-                        pairs.append((from_branch.strip(), to_branch.strip()))
-                    elif '-' in line:
-                        from_branch, to_branch = line.split('-', 1)
-                        pairs.append((from_branch.strip(), to_branch.strip()))
-                    else:
-                        print(f"Warning: Invalid format on line {line_num}: {line}")
+            lines = f.read().splitlines()
+        
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if line and not line.startswith('#'):
+                from_branch, sep, to_branch = line.partition(':')
+                if not sep:
+                    from_branch, sep, to_branch = line.partition('-')
+                if sep:
+                    pairs.append((from_branch.strip(), to_branch.strip()))
+                else:
+                    print(f"Warning: Invalid format on line {line_num}: {line}")
     except FileNotFoundError:
         print(f"Error: Configuration file not found: {config_file}")
         sys.exit(1)
@@ -124,6 +123,17 @@ def main():
     """Main execution function"""
     args = parse_arguments()
     
+    # Set UTF-8 encoding for Windows console
+    if sys.platform == 'win32':
+        import codecs
+        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    
+    # Heavy imports are deferred so --help and argument errors exit quickly
+    from concurrent.futures import ThreadPoolExecutor
+    from .git_comparator import GitComparator
+    from .report_generator import ReportGenerator
+    
     # Determine branch pairs
     branch_pairs = []
     
@@ -170,16 +180,36 @@ def main():
         sys.exit(1)
     
     # Run comparisons
-    comparisons = []
     print("\nRunning comparisons...")
     
-    for from_branch, to_branch in branch_pairs:
+    # Pull each branch once up front; the comparisons themselves run in
+    # isolated worktrees so they can proceed concurrently
+    branches = list(dict.fromkeys(b for pair in branch_pairs for b in pair))
+    if not args.no_pull:
+        print("Pulling latest changes...")
+        comparator.update_branches(branches)
+    
+    # Each comparison collects its progress messages, printed under its
+    # header once all are done so concurrent output does not interleave
+    logs = [[] for _ in branch_pairs]
+    try:
+        max_workers = args.jobs or min(len(branch_pairs), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            comparisons = list(executor.map(
+                lambda pair, lines: comparator.compare_branches(
+                    *pair, isolated=True, log=lines.append),
+                branch_pairs,
+                logs
+            ))
+    finally:
+        comparator.close()
+    
+    for comparison, lines in zip(comparisons, logs):
         print(f"\n{'='*60}")
-        print(f"Comparing: {from_branch} → {to_branch}")
+        print(f"Comparing: {comparison.from_branch} → {comparison.to_branch}")
         print('='*60)
-        
-        comparison = comparator.compare_branches(from_branch, to_branch)
-        comparisons.append(comparison)
+        for line in lines:
+            print(line)
         
         # Print summary
         if comparison.status == 'error':
@@ -189,11 +219,10 @@ def main():
             print(f"Files changed: {len(comparison.changes)}")
             
             if comparison.changes:
-                semantic_changes = sum(1 for c in comparison.changes if c.has_semantic_changes)
-                conflicts = sum(1 for c in comparison.changes if c.has_conflicts)
-                print(f"  - Semantic changes: {semantic_changes}")
-                print(f"  - Formatting only: {len(comparison.changes) - semantic_changes}")
-                print(f"  - Conflicts: {conflicts}")
+                semantic_count, conflict_count = comparison.tallies()
+                print(f"  - Semantic changes: {semantic_count}")
+                print(f"  - Formatting only: {len(comparison.changes) - semantic_count}")
+                print(f"  - Conflicts: {conflict_count}")
     
     # Generate report
     print(f"\n{'='*60}")
@@ -2,11 +2,115 @@
 Git operations and branch comparison logic
 """
 
-from typing import List
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from git import Repo, GitCommandError
 
 from .models import BranchComparison, FileChange
-from .analyzers import FileAnalyzerFactory
+from .analyzers import FileAnalyzerFactory, MAX_ANALYZE_BYTES, _file_extension
+
+
+# Upper bound on memoized blob-pair analyses
+BLOB_PAIR_CACHE_SIZE = 10000
+
+# Request bytes sent to cat-file per round trip, kept below the smallest
+# common pipe buffer size
+CAT_FILE_BATCH_BYTES = 4096
+
+# Chunk size used to discard the unread tail of a truncated cat-file reply
+CAT_FILE_SKIP_BYTES = 64 * 1024
+
+# Threads analyzing changed files, shared by all comparisons of a comparator
+FILE_ANALYSIS_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+class GitCatFileBatch:
+    """Long-running ``git cat-file --batch`` process for reading blobs
+    
+    Reading blobs through a single persistent process avoids spawning a
+    ``git show`` per file. Requests are serialized, so one instance can be
+    shared between threads.
+    """
+    
+    def __init__(self, repo_path: str = '.'):
+        self._proc = subprocess.Popen(
+            ['git', 'cat-file', '--batch'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=repo_path
+        )
+        self._lock = threading.Lock()
+    
+    def read(self, rev: str, path: Optional[str] = None) -> Optional[bytes]:
+        """Read ``rev:path`` (or the object ``rev`` itself when no path is
+        given), returning None if it is missing or not a blob"""
+        query = rev if path is None else f"{rev}:{path}"
+        return self.read_many([query])[0]
+    
+    def read_many(self, queries: List[str], limit: Optional[int] = None) -> List[Optional[bytes]]:
+        """Read several objects, pipelining the requests
+        
+        Queries are sent in batches that fit in the pipe buffer, then all
+        replies of the batch are read; writing a batch therefore never blocks
+        while git waits for its output to be consumed.
+        
+        With ``limit``, contents longer than that are truncated to
+        ``limit + 1`` bytes and the rest is discarded unread, so oversized
+        blobs are still recognizable without being held in memory.
+        """
+        requests = [f"{query}\n".encode('utf-8') for query in queries]
+        results = []
+        with self._lock:
+            start = 0
+            while start < len(requests):
+                end = start + 1
+                size = len(requests[start])
+                while end < len(requests) and size + len(requests[end]) <= CAT_FILE_BATCH_BYTES:
+                    size += len(requests[end])
+                    end += 1
+                
+                self._proc.stdin.write(b''.join(requests[start:end]))
+                self._proc.stdin.flush()
+                results.extend(self._read_reply(limit) for _ in range(end - start))
+                start = end
+        return results
+    
+    def _read_reply(self, limit: Optional[int] = None) -> Optional[bytes]:
+        """Read one reply from the cat-file process"""
+        # Reply is "<sha> <type> <size>\n<content>\n", or "<name> missing\n"
+        # (also "ambiguous") where the name may itself contain spaces
+        header = self._proc.stdout.readline()
+        if not header:
+            raise RuntimeError("git cat-file process exited unexpectedly")
+        parts = header.rstrip(b'\n').rsplit(b' ', 2)
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None
+        
+        size = int(parts[2])
+        keep = size if limit is None else min(size, limit + 1)
+        data = self._proc.stdout.read(keep)
+        # Discard the truncated tail and the newline ending the reply
+        remaining = size - keep + 1
+        while remaining:
+            chunk = self._proc.stdout.read(min(remaining, CAT_FILE_SKIP_BYTES))
+            if not chunk:
+                raise RuntimeError("git cat-file process exited unexpectedly")
+            remaining -= len(chunk)
+        return data if parts[1] == b'blob' else None
+    
+    def close(self):
+        """Terminate the cat-file process"""
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            self._proc.wait()
+        self._proc.stdout.close()
 
 
 class GitComparator:
@@ -16,84 +120,105 @@ class GitComparator:
         self.repo = Repo(repo_path)
         self.original_branch = self.repo.active_branch.name
         self.no_pull = no_pull
+        # Blob reader shared by all comparisons, started on first use
+        self._catfile: Optional[GitCatFileBatch] = None
+        # Pool for per-file analyses, started on first use
+        self._file_pool: Optional[ThreadPoolExecutor] = None
+        # Names of all refs (heads, remotes, tags), listed on first lookup
+        self._ref_names: Optional[Set[str]] = None
+        # LRU of analyses keyed by (analyzer, blob before, blob after), so a
+        # file merged identically in several comparisons is analyzed once
+        self._blob_pair_cache: "OrderedDict[Tuple[str, str, str], FileChange]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Serializes operations on the shared repository metadata
+        # (worktree registration, branch deletion) across worker threads
+        self._lock = threading.Lock()
+    
+    def close(self):
+        """Stop the blob reader process and file analysis pool, if started"""
+        with self._lock:
+            catfile, self._catfile = self._catfile, None
+            file_pool, self._file_pool = self._file_pool, None
+        if file_pool is not None:
+            file_pool.shutdown()
+        if catfile is not None:
+            catfile.close()
+    
+    def _get_catfile(self) -> GitCatFileBatch:
+        """Return the shared blob reader, starting it on first use"""
+        with self._lock:
+            if self._catfile is None:
+                self._catfile = GitCatFileBatch(self.repo.working_dir)
+            return self._catfile
+    
+    def _get_file_pool(self) -> ThreadPoolExecutor:
+        """Return the shared file analysis pool, starting it on first use"""
+        with self._lock:
+            if self._file_pool is None:
+                self._file_pool = ThreadPoolExecutor(max_workers=FILE_ANALYSIS_WORKERS)
+            return self._file_pool
         
-    def compare_branches(self, from_branch: str, to_branch: str) -> BranchComparison:
-        """Compare two branches"""
-        temp_branch = f"{from_branch}-to-{to_branch}"
-        comparison = BranchComparison(
-            from_branch=from_branch,
-            to_branch=to_branch,
-            temp_branch=temp_branch,
-            status='success'
-        )
+    def update_branches(self, branches: Iterable[str]):
+        """Pull latest changes for each branch once, then restore the original branch"""
+        try:
+            for branch in branches:
+                self._pull_branch(branch)
+        finally:
+            try:
+                self.repo.git.checkout(self.original_branch)
+            except Exception as e:
+                print(f"Warning during cleanup: {e}")
+    
+    def _pull_branch(self, branch: str):
+        """Switch to a branch and pull it from origin"""
+        try:
+            self.repo.git.switch(branch)
+            if self.repo.remotes.origin:
+                print(f"Pulling from remote {self.repo.remotes.origin.name}...")
+            self.repo.remotes.origin.pull()
+        except Exception as e:
+            print(f"Warning: Could not pull from remote: {e}")
+    
+    def compare_branches(self, from_branch: str, to_branch: str,
+                         isolated: bool = False,
+                         log: Callable[[str], None] = print) -> BranchComparison:
+        """Compare two branches
+        
+        With ``isolated=True`` the test merge runs in a temporary worktree
+        instead of the main working tree, so several comparisons can run
+        concurrently. Isolated comparisons never pull; call
+        ``update_branches`` beforehand.
+        
+        Progress messages go to ``log``; concurrent callers pass a per-comparison
+        collector and print it once the comparison is done.
+        """
+        if isolated:
+            return self._compare_in_worktree(from_branch, to_branch, log)
+        
+        comparison = self._new_comparison(from_branch, to_branch)
+        temp_branch = comparison.temp_branch
         
         try:
             # Ensure we're up to date
             if not self.no_pull:
-                print(f"Pulling latest changes...")
-                try:
-                    self.repo.git.switch(to_branch)
-                    if self.repo.remotes.origin:
-                        print(f"Pulling from remote {self.repo.remotes.origin.name}...")
-                    self.repo.remotes.origin.pull()
-                except Exception as e:
-                    print(f"Warning: Could not pull from remote: {e}")
-                try:
-                    self.repo.git.switch(from_branch)
-                    if self.repo.remotes.origin:
-                        print(f"Pulling from remote {self.repo.remotes.origin.name}...")
-                    self.repo.remotes.origin.pull()
-                except Exception as e:
-                    print(f"Warning: Could not pull from remote: {e}")
+                log(f"Pulling latest changes...")
+                self._pull_branch(to_branch)
+                self._pull_branch(from_branch)
 
  
             # Validate branches exist
-            if not self._branch_exists(from_branch):
-                comparison.status = 'error'
-                comparison.error_message = f"Branch '{from_branch}' does not exist"
-                return comparison
-                
-            if not self._branch_exists(to_branch):
-                comparison.status = 'error'
-                comparison.error_message = f"Branch '{to_branch}' does not exist"
+            if not self._validate_branches(comparison):
                 return comparison
             
             # Create temporal branch
-            print(f"Creating temporal branch {temp_branch}...")
+            log(f"Creating temporal branch {temp_branch}...")
             self.repo.git.checkout(to_branch)
             self.repo.git.checkout('-b', temp_branch)
             
-            # Attempt merge
-            print(f"Attempting merge from {from_branch}...")
-            try:
-                self.repo.git.merge(from_branch, no_commit=True, no_ff=True)
-                
-                # Get changed files
-                changed_files = self._get_changed_files()
-                
-                # Analyze each file
-                for file_path in changed_files:
-                    print(f"  Analyzing {file_path}...")
-                    analyzer = FileAnalyzerFactory.get_analyzer(file_path)
-                    file_change = analyzer.analyze_differences(file_path, self.repo)
-                    comparison.changes.append(file_change)
-                    
-            except GitCommandError as _:
-                # Merge conflict
-                comparison.status = 'conflict'
-                print("Merge conflicts detected, analyzing...")
-                
-                # Get conflicted files
-                conflicted_files = self._get_conflicted_files()
-                
-                for file_path in conflicted_files:
-                    print(f"  Analyzing conflicts in {file_path}...")
-                    analyzer = FileAnalyzerFactory.get_analyzer(file_path)
-                    file_change = analyzer.analyze_differences(file_path, self.repo, merge_conflicts=True)
-                    comparison.changes.append(file_change)
+            self._merge_and_analyze(self.repo, comparison, log)
             
             # Abort merge
-            print("Aborting merge...")
+            log("Aborting merge...")
             try:
                 self.repo.git.merge('--abort')
             except GitCommandError as _:
@@ -105,64 +230,236 @@ class GitComparator:
             
         finally:
             # Cleanup
-            print("Cleaning up...")
+            log("Cleaning up...")
             try:
                 self.repo.git.checkout(self.original_branch)
                 if temp_branch in [b.name for b in self.repo.branches]:
                     self.repo.git.branch('-D', temp_branch)
             except Exception as e:
-                print(f"Warning during cleanup: {e}")
+                log(f"Warning during cleanup: {e}")
                 
         return comparison
     
+    def _compare_in_worktree(self, from_branch: str, to_branch: str,
+                             log: Callable[[str], None] = print) -> BranchComparison:
+        """Compare two branches using a dedicated temporary worktree"""
+        worktree_dir = tempfile.mkdtemp(prefix='gbc-')
+        # The same pair may be compared twice at once, so the branch name
+        # carries the worktree's unique suffix
+        comparison = self._new_comparison(
+            from_branch, to_branch, f"-{os.path.basename(worktree_dir)[len('gbc-'):]}")
+        temp_branch = comparison.temp_branch
+        
+        if not self._validate_branches(comparison):
+            shutil.rmtree(worktree_dir, ignore_errors=True)
+            return comparison
+        
+        try:
+            # Create temporal branch and register its worktree; only these
+            # ref and metadata updates are serialized, the checkout itself
+            # runs concurrently in the worktree
+            log(f"Creating temporal branch {temp_branch}...")
+            with self._lock:
+                self.repo.git.worktree('add', '--no-checkout', '-b', temp_branch, worktree_dir, to_branch)
+            
+            worktree_repo = Repo(worktree_dir)
+            try:
+                worktree_repo.git.reset('--hard')
+                self._merge_and_analyze(worktree_repo, comparison, log)
+            finally:
+                worktree_repo.close()
+            
+        except Exception as e:
+            comparison.status = 'error'
+            comparison.error_message = str(e)
+            
+        finally:
+            # Cleanup; deleting the worktree also discards the pending merge,
+            # pruning then drops its registration
+            log(f"Cleaning up {temp_branch}...")
+            shutil.rmtree(worktree_dir, ignore_errors=True)
+            try:
+                with self._lock:
+                    self.repo.git.worktree('prune')
+                    if temp_branch in [b.name for b in self.repo.branches]:
+                        self.repo.git.branch('-D', temp_branch)
+            except Exception as e:
+                log(f"Warning during cleanup: {e}")
+                
+        return comparison
+    
+    def _new_comparison(self, from_branch: str, to_branch: str, suffix: str = '') -> BranchComparison:
+        """Start a successful comparison whose temporal branch is
+        ``<from>-to-<to>`` plus ``suffix``"""
+        return BranchComparison(
+            from_branch=from_branch,
+            to_branch=to_branch,
+            temp_branch=f"{from_branch}-to-{to_branch}{suffix}",
+            status='success'
+        )
+    
+    def _validate_branches(self, comparison: BranchComparison) -> bool:
+        """Flag the comparison as an error if either branch is missing"""
+        for branch in (comparison.from_branch, comparison.to_branch):
+            if not self._branch_exists(branch):
+                comparison.status = 'error'
+                comparison.error_message = f"Branch '{branch}' does not exist"
+                return False
+        return True
+    
+    def _merge_and_analyze(self, repo: Repo, comparison: BranchComparison,
+                           log: Callable[[str], None] = print):
+        """Test-merge the from branch into the checked out temp branch of repo"""
+        log(f"Attempting merge from {comparison.from_branch}...")
+        try:
+            repo.git.merge(comparison.from_branch, no_commit=True, no_ff=True)
+            
+            # Get changed files
+            blob_ids = self._get_staged_blob_ids(repo)
+            changed_files = self._get_changed_files(repo, blob_ids)
+            
+            # Reuse memoized analyses; only the remaining files are read
+            pending = []
+            for file_path in changed_files:
+                analyzer = FileAnalyzerFactory.get_analyzer(file_path)
+                ids = blob_ids.get(file_path)
+                key = (analyzer.__class__.__name__,) + ids if ids else None
+                pending.append((file_path, analyzer, key, self._cached_analysis(key, file_path)))
+            
+            read_blob = self._prefetch_head_blobs(
+                repo,
+                [file_path for file_path, _, _, cached in pending if cached is None],
+                blob_ids
+            )
+            
+            # Analyze the remaining files concurrently, keeping their order
+            def analyze(item):
+                file_path, analyzer, _, cached = item
+                if cached is not None:
+                    return cached
+                return analyzer.analyze_differences(file_path, repo, read_blob=read_blob)
+            
+            results = self._get_file_pool().map(analyze, pending)
+            for (file_path, _, key, cached), file_change in zip(pending, results):
+                log(f"  Analyzing {file_path}...")
+                if cached is None and key is not None and file_change.error_message is None:
+                    self._store_analysis(key, file_change)
+                comparison.changes.append(file_change)
+                
+        except GitCommandError as _:
+            # Merge conflict
+            comparison.status = 'conflict'
+            log("Merge conflicts detected, analyzing...")
+            
+            # Get conflicted files
+            conflicted_files = self._get_conflicted_files(repo)
+            
+            results = self._get_file_pool().map(
+                lambda file_path: FileAnalyzerFactory.get_analyzer(file_path).analyze_differences(
+                    file_path, repo, merge_conflicts=True),
+                conflicted_files
+            )
+            for file_path, file_change in zip(conflicted_files, results):
+                log(f"  Analyzing conflicts in {file_path}...")
+                comparison.changes.append(file_change)
+    
+    def _prefetch_head_blobs(self, repo: Repo, paths: List[str],
+                             blob_ids: Dict[str, Tuple[str, str]]
+                             ) -> Callable[[str], Optional[bytes]]:
+        """Read the HEAD version of all paths in one pipelined cat-file batch,
+        returning a reader for analyze_differences"""
+        # Prefer object ids from the staged diff over "<commit>:<path>",
+        # resolved by commit sha so worktrees work too
+        head_sha = repo.head.commit.hexsha
+        queries = {}
+        for path in paths:
+            blob_id = blob_ids.get(path, (None,))[0]
+            if blob_id is None:
+                queries[path] = f"{head_sha}:{path}"
+            elif blob_id.strip('0'):
+                queries[path] = blob_id
+        
+        if not queries:
+            return {}.get
+        # Blobs over the analysis limit arrive truncated, enough for the
+        # analyzer to skip them
+        contents = dict(zip(queries, self._get_catfile().read_many(list(queries.values()),
+                                                                     limit=MAX_ANALYZE_BYTES)))
+        return contents.get
+    
+    def _cached_analysis(self, key: Optional[Tuple[str, str, str]], file_path: str) -> Optional[FileChange]:
+        """Return a copy of the memoized analysis for this blob pair, if any"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._blob_pair_cache.get(key)
+            if cached is None:
+                return None
+            self._blob_pair_cache.move_to_end(key)
+        return replace(
+            cached,
+            file_path=file_path,
+            # Paths sharing an analyzer may still differ in extension
+            file_type=_file_extension(file_path),
+            summary=dict(cached.summary),
+            detailed_analysis=dict(cached.detailed_analysis),
+            format_specific=dict(cached.format_specific)
+        )
+    
+    def _store_analysis(self, key: Tuple[str, str, str], change: FileChange):
+        """Memoize an analysis, evicting the least recently used entry"""
+        with self._cache_lock:
+            self._blob_pair_cache[key] = change
+            if len(self._blob_pair_cache) > BLOB_PAIR_CACHE_SIZE:
+                self._blob_pair_cache.popitem(last=False)
+    
+    def _get_staged_blob_ids(self, repo: Repo) -> Dict[str, Tuple[str, str]]:
+        """Map each staged path to its (HEAD blob, merged blob) ids"""
+        # Entries are ":<mode> <mode> <sha> <sha> <status>\0<path>\0"
+        raw = repo.git.diff('--cached', '--raw', '-z', '--no-abbrev', '--no-renames')
+        fields = raw.split('\0')
+        blob_ids = {}
+        for meta, path in zip(fields[::2], fields[1::2]):
+            _, _, before_id, after_id, _ = meta.split()
+            blob_ids[path] = (before_id, after_id)
+        return blob_ids
+    
     def _branch_exists(self, branch_name: str) -> bool:
         """Check if branch exists"""
+        # Ref names are read in process, once; other revisions such as
+        # shas or 'refs/heads/<name>' are still verified by git
+        if self._ref_names is None:
+            self._ref_names = {ref.name for ref in self.repo.references}
+        if branch_name in self._ref_names:
+            return True
         try:
             self.repo.git.rev_parse('--verify', branch_name)
             return True
         except GitCommandError:
             return False
     
-    def _get_changed_files(self) -> List[str]:
-        """Get list of changed files in current merge"""
-        # Get files that would be changed in the merge
-        diff = self.repo.index.diff(None)
-        staged = self.repo.index.diff("HEAD")
+    def _get_changed_files(self, repo: Repo, staged: Optional[Iterable[str]] = None) -> List[str]:
+        """Get list of changed files in current merge
         
-        changed_files = set()
-        for d in diff:
-            changed_files.add(d.a_path)
-        for d in staged:
-            changed_files.add(d.a_path)
-            
-        # Also check for untracked files in merge
-        status = self.repo.git.status('--porcelain')
-        for line in status.splitlines():
-            if line.startswith(('M ', 'A ', 'D ', 'R ')):
-                changed_files.add(line[3:])
-            
-        return list(changed_files)
+        ``staged`` are the paths already known to differ between HEAD and
+        the index, e.g. the keys of ``_get_staged_blob_ids``; they are listed
+        with git otherwise.
+        """
+        if staged is None:
+            staged = self._diff_names(repo, '--cached')
+        # Staged merge results plus any changes left in the working tree
+        return sorted({*staged, *self._diff_names(repo)})
     
-    def _get_conflicted_files(self) -> List[str]:
+    def _get_conflicted_files(self, repo: Repo) -> List[str]:
         """Get list of files with merge conflicts"""
-        conflicted = []
         try:
-            status = self.repo.git.status('--porcelain')
-            for line in status.splitlines():
-                if line.startswith('UU '):
-                    conflicted.append(line[3:])
-                elif line.startswith('AA '):
-                    conflicted.append(line[3:])
-                elif line.startswith('DD '):
-                    conflicted.append(line[3:])
-                elif line.startswith('AU '):
-                    conflicted.append(line[3:])
-                elif line.startswith('UA '):
-                    conflicted.append(line[3:])
-                elif line.startswith('DU '):
-                    conflicted.append(line[3:])
-                elif line.startswith('UD '):
-                    conflicted.append(line[3:])
+            return self._diff_names(repo, '--diff-filter=U')
         except:
-            pass
-        return conflicted
\ No newline at end of file
+            return []
+    
+    def _diff_names(self, repo: Repo, *args: str) -> List[str]:
+        """List the paths reported by ``git diff --name-only``"""
+        # NUL separated so unusual paths are not quoted; renames are listed
+        # as a deletion plus an addition, like the staged blob ids
+        out = repo.git.diff('--name-only', '-z', '--no-renames', *args)
+        return [path for path in out.split('\0') if path]
@@ -2,11 +2,16 @@
 Data models for Git Branch Comparison Tool
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 
-@dataclass
+# Slotted instances drop the per-instance __dict__; the option needs 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FileChange:
     """Represents changes in a single file"""
     file_path: str
@@ -23,7 +28,7 @@ class FileChange:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BranchComparison:
     """Results of comparing two branches"""
     from_branch: str
@@ -31,4 +36,14 @@ class BranchComparison:
     temp_branch: str
     status: str  # 'success', 'conflict', 'error'
     changes: List[FileChange] = field(default_factory=list)
-    error_message: Optional[str] = None
\ No newline at end of file
+    error_message: Optional[str] = None
+    
+    def tallies(self) -> Tuple[int, int]:
+        """Count (semantic, conflicting) changes in a single pass"""
+        semantic = conflicts = 0
+        for change in self.changes:
+            if change.has_semantic_changes:
+                semantic += 1
+            if change.has_conflicts:
+                conflicts += 1
+        return semantic, conflicts
\ No newline at end of file
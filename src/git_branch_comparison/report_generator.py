@@ -2,60 +2,267 @@
 Jupyter notebook report generator - Markdown only version
 """
 
+from collections import defaultdict
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Any, List, Tuple
+import difflib
+import hashlib
 import json
+import os
+import re
 
 import nbformat as nbf
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator, see the 'fast' extra
+    orjson = None
+
 from .models import BranchComparison, FileChange
 
+# Readable forms of FileChange.detailed_analysis['skipped']
+_SKIP_REASONS = {
+    'binary': 'binary file',
+    'large': 'file too large to analyze',
+}
+
+# Serialized cells are gathered and written in chunks of about this size
+WRITE_BUFFER_BYTES = 1 << 20
+
+# Most buffers a single os.writev call accepts, 0 where writev is missing
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'writev') else 0
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a notebook fragment to UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
+def _unified_diff(before: str, after: str, max_lines: int = 100) -> Tuple[int, Tuple[str, ...]]:
+    """Return the total line count and first lines of a unified diff
+    
+    Not cached: identical before/after pairs are cross-referenced before a
+    diff is rendered, and keeping contents alive would defeat streaming.
+    """
+    diff_lines = list(difflib.unified_diff(
+        before.splitlines(keepends=True),
+        after.splitlines(keepends=True),
+        fromfile='Before',
+        tofile='After',
+        n=3  # Context lines
+    ))
+    return len(diff_lines), tuple(line.rstrip() for line in diff_lines[:max_lines])
+
+
+@lru_cache(maxsize=1024)
+def _format_xml_insights(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Format XML-specific insights from sorted format_specific items
+    
+    Cached because the same config change often repeats across many files.
+    """
+    insights = dict(items)
+    result = []
+    if insights.get('elements_added', 0) > 0:
+        result.append(f"- Elements added: {insights['elements_added']}\n")
+    if insights.get('elements_removed', 0) > 0:
+        result.append(f"- Elements removed: {insights['elements_removed']}\n")
+    if insights.get('elements_reordered', 0) > 0:
+        result.append(f"- Elements reordered: {insights['elements_reordered']}\n")
+    if insights.get('attributes_reordered', 0) > 0:
+        result.append(f"- Attributes reordered: {insights['attributes_reordered']}\n")
+    if insights.get('attribute_changes', 0) > 0:
+        result.append(f"- Attribute value changes: {insights['attribute_changes']}\n")
+    if insights.get('text_changes', 0) > 0:
+        result.append(f"- Text content changes: {insights['text_changes']}\n")
+    if insights.get('namespace_changes', 0) > 0:
+        result.append(f"- Namespace changes: {insights['namespace_changes']}\n")
+    if 'parse_error' in insights:
+        result.append(f"- **Parse Error:** {insights['parse_error']}\n")
+    return "".join(result)
+
+
+@lru_cache(maxsize=1024)
+def _format_yaml_insights(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Format YAML-specific insights from sorted format_specific items"""
+    insights = dict(items)
+    result = []
+    if insights.get('document_count_changed'):
+        result.append("- Document count changed\n")
+    if insights.get('key_reordering', 0) > 0:
+        result.append(f"- Keys reordered: {insights['key_reordering']}\n")
+    if insights.get('semantic_differences', 0) > 0:
+        result.append(f"- Semantic differences: {insights['semantic_differences']}\n")
+    if insights.get('style_changes', 0) > 0:
+        result.append(f"- Style changes: {insights['style_changes']}\n")
+    if 'parse_error' in insights:
+        result.append(f"- **Parse Error:** {insights['parse_error']}\n")
+    return "".join(result)
+
+
+@lru_cache(maxsize=1024)
+def _format_properties_insights(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Format Properties file insights from sorted format_specific items"""
+    insights = dict(items)
+    result = []
+    if insights.get('added_properties', 0) > 0:
+        result.append(f"- Properties added: {insights['added_properties']}\n")
+    if insights.get('removed_properties', 0) > 0:
+        result.append(f"- Properties removed: {insights['removed_properties']}\n")
+    if insights.get('value_changes', 0) > 0:
+        result.append(f"- Property value changes: {insights['value_changes']}\n")
+    if insights.get('reordered_properties', 0) > 0:
+        result.append(f"- Properties reordered: {insights['reordered_properties']}\n")
+    return "".join(result)
+
+
+def _blob_id(content: str) -> str:
+    """Git-style blob id of a text, used to dedupe embedded contents"""
+    data = content.encode('utf-8')
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _diff_key(change: FileChange) -> Tuple[str, bytes, bytes]:
+    """Fingerprint of an analysis: analyzer plus before/after content digests"""
+    return (
+        change.analyzer_used,
+        hashlib.blake2b((change.content_before or '').encode('utf-8'), digest_size=16).digest(),
+        hashlib.blake2b((change.content_after or '').encode('utf-8'), digest_size=16).digest(),
+    )
+
+
+def _code_fence(text: str) -> str:
+    """Return a backtick fence longer than any backtick run inside text"""
+    longest = max((len(run) for run in re.findall(r'`+', text)), default=0)
+    return '`' * max(3, longest + 1)
+
 
 class ReportGenerator:
-    """Generate Jupyter notebook reports using only Markdown"""
+    """Generate Jupyter notebook reports using only Markdown
+    
+    Cells are serialized as soon as they are created and flushed to the
+    output file in ~1 MiB vectored writes, so memory use does not grow with
+    the size of the report.
+    """
     
     def __init__(self):
-        self.nb = nbf.v4.new_notebook()
-        self.nb.metadata = {
+        self.metadata = {
             'kernelspec': {
                 'display_name': 'Python 3',
                 'language': 'python',
                 'name': 'python3'
             }
         }
+        self._fd = None
+        self._pending = []
+        self._pending_bytes = 0
+        self._first_cell = True
+        # Diff fingerprint -> (anchor, file path, section) of its first analysis
+        self._seen_diffs = {}
     
     def generate_report(self, comparisons: List[BranchComparison], output_path: str):
-        """Generate complete report notebook"""
-        # Title cell
-        self._add_markdown_cell(
-            f"Git Branch Comparison Report\n\n"
-            f"**Generated on:** {self._get_timestamp()}\n\n"
-            "---"
-        )
-        
-        # Table of Contents
-        self._add_table_of_contents(comparisons)
-        
-        # Summary dashboard
-        self._add_summary_dashboard(comparisons)
-        
-        # Add section for each comparison
-        for idx, comparison in enumerate(comparisons):
-            self._add_comparison_section(comparison, idx + 1)
-        
-        # Save notebook with UTF-8 encoding
-        with open(output_path, 'w', encoding='utf-8') as f:
-            nbf.write(self.nb, f)
+        """Generate complete report notebook
+        
+        Cells are streamed to a temporary file next to ``output_path``, which
+        only replaces it once the whole notebook is written; a failure leaves
+        an existing report intact.
+        """
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        # O_BINARY keeps Windows from translating newlines in the raw writes
+        self._fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+                           0o644)
+        completed = False
+        try:
+            self._first_cell = True
+            self._seen_diffs = {}
+            self._emit(b'{"cells": [\n')
+            
+            # Title cell
+            self._add_markdown_cell(
+                f"Git Branch Comparison Report\n\n"
+                f"**Generated on:** {self._get_timestamp()}\n\n"
+                "---"
+            )
+            
+            # Table of Contents
+            self._add_table_of_contents(comparisons)
+            
+            # Summary dashboard
+            self._add_summary_dashboard(comparisons)
+            
+            # File contents referenced by the code cells
+            self._add_blobs_cell(comparisons)
+            
+            # Add section for each comparison
+            for idx, comparison in enumerate(comparisons):
+                self._add_comparison_section(comparison, idx + 1)
+            
+            self._emit(b'\n], "metadata": ')
+            self._emit(_dumps(self.metadata))
+            self._emit(
+                f', "nbformat": {nbf.v4.nbformat}, "nbformat_minor": {nbf.v4.nbformat_minor}}}\n'.encode()
+            )
+            self._flush()
+            completed = True
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self._pending = []
+            self._pending_bytes = 0
+            if completed:
+                os.replace(temp_path, output_path)
+            else:
+                os.remove(temp_path)
         
         print(f"Report generated: {output_path}")
     
+    def _emit(self, data: bytes):
+        """Queue serialized bytes, flushing once enough are pending"""
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        if self._pending_bytes >= WRITE_BUFFER_BYTES:
+            self._flush()
+    
+    def _flush(self):
+        """Write all pending chunks to the output file"""
+        chunks = [memoryview(chunk) for chunk in self._pending]
+        self._pending = []
+        self._pending_bytes = 0
+        start = 0
+        while start < len(chunks):
+            if _IOV_MAX:
+                written = os.writev(self._fd, chunks[start:start + _IOV_MAX])
+            else:  # No writev, e.g. Windows
+                written = os.write(self._fd, chunks[start])
+            # Skip fully written chunks and trim a partially written one
+            while start < len(chunks) and written >= len(chunks[start]):
+                written -= len(chunks[start])
+                start += 1
+            if written:
+                chunks[start] = chunks[start][written:]
+    
+    def _write_cell(self, cell: dict):
+        """Serialize a cell and queue it for the output file"""
+        if not self._first_cell:
+            self._emit(b',\n')
+        self._first_cell = False
+        self._emit(_dumps(cell))
+    
     def _add_markdown_cell(self, content: str):
         """Add markdown cell to notebook"""
-        self.nb.cells.append(nbf.v4.new_markdown_cell(content))
+        # Sources are stored as lists of lines, as nbformat writes them; the
+        # file as a whole is valid nbformat but not byte-identical to
+        # nbformat.writes() output
+        cell = nbf.v4.new_markdown_cell()
+        cell['source'] = content.splitlines(keepends=True)
+        self._write_cell(cell)
     
     def _add_code_cell(self, code: str):
         """Add code cell to notebook"""
-        cell = nbf.v4.new_code_cell(code)
+        cell = nbf.v4.new_code_cell()
+        cell['source'] = code.splitlines(keepends=True)
         cell.metadata = {
             'collapsed': True,
             'jupyter': {
@@ -64,18 +271,18 @@ class ReportGenerator:
             'tags': ['hide-input']
         }
         
-        self.nb.cells.append(cell)
+        self._write_cell(cell)
     
     def _add_table_of_contents(self, comparisons: List[BranchComparison]):
         """Add table of contents"""
-        toc = "Table of Contents\n\n"
-        toc += "1. [Summary Dashboard](#summary-dashboard)\n"
+        toc = ["Table of Contents\n\n"]
+        toc.append("1. [Summary Dashboard](#summary-dashboard)\n")
         
         for idx, comp in enumerate(comparisons):
             section_num = idx + 1
-            toc += f"{section_num + 1}. [Comparison: {comp.from_branch} → {comp.to_branch}](#comparison-{section_num})\n"
+            toc.append(f"{section_num + 1}. [Comparison: {comp.from_branch} → {comp.to_branch}](#comparison-{section_num})\n")
         
-        self._add_markdown_cell(toc)
+        self._add_markdown_cell("".join(toc))
     
     def _add_summary_dashboard(self, comparisons: List[BranchComparison]):
         """Add summary dashboard"""
@@ -89,29 +296,41 @@ class ReportGenerator:
         total_conflicts = sum(1 for c in comparisons if c.status == 'conflict')
         total_errors = sum(1 for c in comparisons if c.status == 'error')
         
-        stats = f"Overall Statistics\n\n"
-        stats += f"- **Total Comparisons:** {len(comparisons)}\n"
-        stats += f"- **Total Files Changed:** {total_files}\n"
-        stats += f"- **Comparisons with Conflicts:** {total_conflicts}\n"
-        stats += f"- **Comparisons with Errors:** {total_errors}\n\n"
+        stats = [f"Overall Statistics\n\n"]
+        stats.append(f"- **Total Comparisons:** {len(comparisons)}\n")
+        stats.append(f"- **Total Files Changed:** {total_files}\n")
+        stats.append(f"- **Comparisons with Conflicts:** {total_conflicts}\n")
+        stats.append(f"- **Comparisons with Errors:** {total_errors}\n\n")
         
-        self._add_markdown_cell(stats)
+        self._add_markdown_cell("".join(stats))
         
         # Comparison table
-        table = "Comparison Overview\n\n"
-        table += "| From Branch | To Branch | Status | Files | Semantic | Formatting | Conflicts |\n"
-        table += "|-------------|-----------|--------|-------|----------|------------|----------|\n"
+        table = ["Comparison Overview\n\n"]
+        table.append("| From Branch | To Branch | Status | Files | Semantic | Formatting | Conflicts |\n")
+        table.append("|-------------|-----------|--------|-------|----------|------------|----------|\n")
         
         for comp in comparisons:
-            conflict_count = sum(1 for c in comp.changes if c.has_conflicts)
-            semantic_count = sum(1 for c in comp.changes if c.has_semantic_changes)
+            semantic_count, conflict_count = comp.tallies()
             formatting_count = len(comp.changes) - semantic_count
             
             status_badge = "SUCCESS" if comp.status == 'success' else ("CONFLICT" if comp.status == 'conflict' else "ERROR")
-            table += f"| {comp.from_branch} | {comp.to_branch} | {status_badge} | "
-            table += f"{len(comp.changes)} | {semantic_count} | {formatting_count} | {conflict_count} |\n"
+            table.append(f"| {comp.from_branch} | {comp.to_branch} | {status_badge} | ")
+            table.append(f"{len(comp.changes)} | {semantic_count} | {formatting_count} | {conflict_count} |\n")
         
-        self._add_markdown_cell(table)
+        self._add_markdown_cell("".join(table))
+    
+    def _add_blobs_cell(self, comparisons: List[BranchComparison]):
+        """Add one hidden cell defining ``_BLOBS``, every embedded file
+        content keyed by blob id, so repeated contents are stored once"""
+        blobs = {}
+        for comparison in comparisons:
+            for change in comparison.changes:
+                if change.has_conflicts and change.conflict_content:
+                    blobs[_blob_id(change.conflict_content)] = change.conflict_content
+        
+        if blobs:
+            # A JSON object of strings is also a valid Python dict literal
+            self._add_code_cell(f"_BLOBS = {_dumps(blobs).decode('utf-8')}\n")
     
     def _add_comparison_section(self, comparison: BranchComparison, section_num: int):
         """Add section for single branch comparison"""
@@ -140,46 +359,39 @@ class ReportGenerator:
         
         # Add analysis for each file
         for idx, change in enumerate(comparison.changes):
-            self._add_file_analysis(change, idx)
+            self._add_file_analysis(change, section_num, idx)
     
     def _add_file_type_summary(self, comparison: BranchComparison):
         """Add file type summary"""
-        by_type = {}
+        by_type = defaultdict(lambda: {
+            'count': 0,
+            'semantic': 0,
+            'formatting': 0,
+            'conflicts': 0,
+            'analyzer': ''
+        })
         for change in comparison.changes:
-            file_type = change.file_type or 'other'
-            if file_type not in by_type:
-                by_type[file_type] = {
-                    'count': 0,
-                    'semantic': 0,
-                    'formatting': 0,
-                    'conflicts': 0,
-                    'analyzer': ''
-                }
-            
-            by_type[file_type]['count'] += 1
-            by_type[file_type]['analyzer'] = change.analyzer_used
-            if change.has_semantic_changes:
-                by_type[file_type]['semantic'] += 1
-            else:
-                by_type[file_type]['formatting'] += 1
-            if change.has_conflicts:
-                by_type[file_type]['conflicts'] += 1
+            stats = by_type[change.file_type or 'other']
+            stats['count'] += 1
+            stats['analyzer'] = change.analyzer_used
+            stats['semantic' if change.has_semantic_changes else 'formatting'] += 1
+            stats['conflicts'] += change.has_conflicts
         
-        summary = "Files by Type\n\n"
+        summary = ["Files by Type\n\n"]
         for file_type, stats in sorted(by_type.items()):
-            summary += f"{file_type} files ({stats['analyzer']})\n"
-            summary += f"- Total: {stats['count']}\n"
-            summary += f"- Semantic changes: {stats['semantic']}\n"
-            summary += f"- Formatting only: {stats['formatting']}\n"
+            summary.append(f"{file_type} files ({stats['analyzer']})\n")
+            summary.append(f"- Total: {stats['count']}\n")
+            summary.append(f"- Semantic changes: {stats['semantic']}\n")
+            summary.append(f"- Formatting only: {stats['formatting']}\n")
             if stats['conflicts'] > 0:
-                summary += f"- With conflicts: {stats['conflicts']}\n"
-            summary += "\n"
+                summary.append(f"- With conflicts: {stats['conflicts']}\n")
+            summary.append("\n")
         
-        self._add_markdown_cell(summary)
+        self._add_markdown_cell("".join(summary))
     
     def _add_changes_summary(self, comparison: BranchComparison):
         """Add a summary list of all changes"""
-        summary = "Changes Summary\n\n"
+        summary = ["Changes Summary\n\n"]
         
         # Group files by change type
         semantic_changes = []
@@ -195,135 +407,107 @@ class ReportGenerator:
                 formatting_changes.append(change)
         
         if conflicts:
-            summary += "Files with Conflicts\n\n"
+            summary.append("Files with Conflicts\n\n")
             for change in conflicts:
-                summary += f"- **{change.file_path}** - {change.analyzer_used}\n"
-            summary += "\n"
+                summary.append(f"- **{change.file_path}** - {change.analyzer_used}\n")
+            summary.append("\n")
         
         if semantic_changes:
-            summary += "Files with Semantic Changes\n\n"
+            summary.append("Files with Semantic Changes\n\n")
             for change in semantic_changes:
                 additions = change.summary.get('additions', 0)
                 deletions = change.summary.get('deletions', 0)
-                summary += f"- **{change.file_path}** - {change.analyzer_used} (+{additions}/-{deletions})\n"
-            summary += "\n"
+                summary.append(f"- **{change.file_path}** - {change.analyzer_used} (+{additions}/-{deletions})\n")
+            summary.append("\n")
         
         if formatting_changes:
-            summary += "Files with Formatting Changes Only\n\n"
+            summary.append("Files with Formatting Changes Only\n\n")
             for change in formatting_changes:
-                summary += f"- **{change.file_path}** - {change.analyzer_used}\n"
-            summary += "\n"
+                summary.append(f"- **{change.file_path}** - {change.analyzer_used}\n")
+            summary.append("\n")
         
-        self._add_markdown_cell(summary)
+        self._add_markdown_cell("".join(summary))
     
-    def _add_file_analysis(self, change: FileChange, idx: int):
+    def _add_file_analysis(self, change: FileChange, section_num: int, idx: int):
         """Add analysis for single file"""
         status = "[CONFLICT]" if change.has_conflicts else ("[SEMANTIC]" if change.has_semantic_changes else "[FORMATTING]")
+        anchor = f"file-{section_num}-{idx}"
+        
+        # Identical diffs, e.g. templated files or a change shared by several
+        # comparisons, are analyzed once and cross-referenced afterwards
+        if not (change.has_conflicts or change.error_message or
+                change.detailed_analysis.get('skipped')):
+            key = _diff_key(change)
+            seen = self._seen_diffs.get(key)
+            if seen:
+                first_anchor, first_path, first_section = seen
+                self._add_markdown_cell(
+                    f"{status} {change.file_path} — identical diff as "
+                    f"[{first_path} in section {first_section}](#{first_anchor})"
+                )
+                return
+            self._seen_diffs[key] = (anchor, change.file_path, section_num)
         
         # File header
-        header = f"{status} {change.file_path}\n\n"
-        header += f"- **File Type:** {change.file_type}\n"
-        header += f"- **Analyzer Used:** {change.analyzer_used}\n"
-        header += f"- **Has Semantic Changes:** {'Yes' if change.has_semantic_changes else 'No'}\n"
-        header += f"- **Has Conflicts:** {'Yes' if change.has_conflicts else 'No'}\n"
+        header = [f"{status} {change.file_path}\n\n<a id='{anchor}'></a>\n\n"]
+        header.append(f"- **File Type:** {change.file_type}\n")
+        header.append(f"- **Analyzer Used:** {change.analyzer_used}\n")
+        header.append(f"- **Has Semantic Changes:** {'Yes' if change.has_semantic_changes else 'No'}\n")
+        header.append(f"- **Has Conflicts:** {'Yes' if change.has_conflicts else 'No'}\n")
         
         if change.summary:
-            header += f"- **Lines Added:** {change.summary.get('additions', 0)}\n"
-            header += f"- **Lines Deleted:** {change.summary.get('deletions', 0)}\n"
+            header.append(f"- **Lines Added:** {change.summary.get('additions', 0)}\n")
+            header.append(f"- **Lines Deleted:** {change.summary.get('deletions', 0)}\n")
         
-        self._add_markdown_cell(header)
+        self._add_markdown_cell("".join(header))
         
         # Format-specific insights
         if change.format_specific:
-            insights = "Format-Specific Analysis\n\n"
+            insights = ["Format-Specific Analysis\n\n"]
             
             # Present insights in a readable way based on analyzer type
+            items = tuple(sorted(change.format_specific.items()))
             if change.analyzer_used == 'XMLAnalyzer':
-                insights += self._format_xml_insights(change.format_specific)
+                insights.append(_format_xml_insights(items))
             elif change.analyzer_used == 'YAMLAnalyzer':
-                insights += self._format_yaml_insights(change.format_specific)
+                insights.append(_format_yaml_insights(items))
             elif change.analyzer_used == 'PropertiesAnalyzer':
-                insights += self._format_properties_insights(change.format_specific)
+                insights.append(_format_properties_insights(items))
             else:
                 # Generic format
-                for key, value in sorted(change.format_specific.items()):
+                for key, value in items:
                     readable_key = key.replace('_', ' ').title()
-                    insights += f"- {readable_key}: {value}\n"
+                    insights.append(f"- {readable_key}: {value}\n")
             
-            self._add_markdown_cell(insights)
+            self._add_markdown_cell("".join(insights))
         
         # Detailed analysis
         if change.detailed_analysis:
-            details = "Detailed Analysis\n\n"
+            details = ["Detailed Analysis\n\n"]
+            
+            skipped = change.detailed_analysis.get('skipped')
+            if skipped:
+                details.append(f"- **Analysis skipped:** {_SKIP_REASONS.get(skipped, skipped)}\n")
             
             if change.detailed_analysis.get('whitespace_only'):
-                details += "- **This file contains only whitespace changes**\n"
+                details.append("- **This file contains only whitespace changes**\n")
             
             if 'moved_blocks' in change.detailed_analysis:
                 moved = change.detailed_analysis['moved_blocks']
-                details += f"- **Moved Blocks:** {len(moved)} code blocks were relocated\n"
+                details.append(f"- **Moved Blocks:** {len(moved)} code blocks were relocated\n")
                 for i, block in enumerate(moved[:3]):  # Show first 3
-                    details += f"  - Block {i+1}: {block['size']} lines moved from line {block['old_position']} to {block['new_position']}\n"
+                    details.append(f"  - Block {i+1}: {block['size']} lines moved from line {block['old_position']} to {block['new_position']}\n")
                 if len(moved) > 3:
-                    details += f"  - ... and {len(moved) - 3} more blocks\n"
+                    details.append(f"  - ... and {len(moved) - 3} more blocks\n")
             
-            self._add_markdown_cell(details)
+            self._add_markdown_cell("".join(details))
         
         # For conflicts, show the conflict details
         if change.has_conflicts and change.detailed_analysis.get('conflicts'):
             self._add_conflict_details(change)
         
         # Add a simple diff view using code blocks
-        self._add_simple_diff(change, idx)
-    
-    def _format_xml_insights(self, insights: dict) -> str:
-        """Format XML-specific insights"""
-        result = ""
-        if insights.get('elements_added', 0) > 0:
-            result += f"- Elements added: {insights['elements_added']}\n"
-        if insights.get('elements_removed', 0) > 0:
-            result += f"- Elements removed: {insights['elements_removed']}\n"
-        if insights.get('elements_reordered', 0) > 0:
-            result += f"- Elements reordered: {insights['elements_reordered']}\n"
-        if insights.get('attributes_reordered', 0) > 0:
-            result += f"- Attributes reordered: {insights['attributes_reordered']}\n"
-        if insights.get('attribute_changes', 0) > 0:
-            result += f"- Attribute value changes: {insights['attribute_changes']}\n"
-        if insights.get('text_changes', 0) > 0:
-            result += f"- Text content changes: {insights['text_changes']}\n"
-        if insights.get('namespace_changes', 0) > 0:
-            result += f"- Namespace changes: {insights['namespace_changes']}\n"
-        if 'parse_error' in insights:
-            result += f"- **Parse Error:** {insights['parse_error']}\n"
-        return result
-    
-    def _format_yaml_insights(self, insights: dict) -> str:
-        """Format YAML-specific insights"""
-        result = ""
-        if insights.get('document_count_changed'):
-            result += "- Document count changed\n"
-        if insights.get('key_reordering', 0) > 0:
-            result += f"- Keys reordered: {insights['key_reordering']}\n"
-        if insights.get('semantic_differences', 0) > 0:
-            result += f"- Semantic differences: {insights['semantic_differences']}\n"
-        if insights.get('style_changes', 0) > 0:
-            result += f"- Style changes: {insights['style_changes']}\n"
-        if 'parse_error' in insights:
-            result += f"- **Parse Error:** {insights['parse_error']}\n"
-        return result
-    
-    def _format_properties_insights(self, insights: dict) -> str:
-        """Format Properties file insights"""
-        result = ""
-        if insights.get('added_properties', 0) > 0:
-            result += f"- Properties added: {insights['added_properties']}\n"
-        if insights.get('removed_properties', 0) > 0:
-            result += f"- Properties removed: {insights['removed_properties']}\n"
-        if insights.get('value_changes', 0) > 0:
-            result += f"- Property value changes: {insights['value_changes']}\n"
-        if insights.get('reordered_properties', 0) > 0:
-            result += f"- Properties reordered: {insights['reordered_properties']}\n"
-        return result
+        self._add_simple_diff(change, section_num, idx)
     
     def _add_conflict_details(self, change: FileChange):
         """Add conflict details"""
@@ -331,25 +515,25 @@ class ReportGenerator:
         if not conflicts:
             return
         
-        details = f"Conflict Details\n\n"
-        details += f"This file has {len(conflicts)} merge conflict(s).\n\n"
+        details = [f"Conflict Details\n\n"]
+        details.append(f"This file has {len(conflicts)} merge conflict(s).\n\n")
         
         for i, conflict in enumerate(conflicts[:2]):  # Show first 2 conflicts
-            details += f"**Conflict {i+1}:**\n\n"
-            details += "```diff\n"
-            details += "<<<<<<< OURS\n"
-            details += conflict['ours'][:200] + ('...' if len(conflict['ours']) > 200 else '')
-            details += "\n=======\n"
-            details += conflict['theirs'][:200] + ('...' if len(conflict['theirs']) > 200 else '')
-            details += "\n>>>>>>> THEIRS\n"
-            details += "```\n\n"
+            details.append(f"**Conflict {i+1}:**\n\n")
+            details.append("```diff\n")
+            details.append("<<<<<<< OURS\n")
+            details.append(conflict['ours'][:200] + ('...' if len(conflict['ours']) > 200 else ''))
+            details.append("\n=======\n")
+            details.append(conflict['theirs'][:200] + ('...' if len(conflict['theirs']) > 200 else ''))
+            details.append("\n>>>>>>> THEIRS\n")
+            details.append("```\n\n")
         
         if len(conflicts) > 2:
-            details += f"*... and {len(conflicts) - 2} more conflict(s)*\n\n"
+            details.append(f"*... and {len(conflicts) - 2} more conflict(s)*\n\n")
         
-        self._add_markdown_cell(details)
+        self._add_markdown_cell("".join(details))
     
-    def _add_simple_diff(self, change: FileChange, idx: int):
+    def _add_simple_diff(self, change: FileChange, section_num: int, idx: int):
         """Add a simple diff view using code blocks"""
         if change.has_conflicts:
             # For conflicts, show the raw conflict file
@@ -363,7 +547,7 @@ class ReportGenerator:
                     preview += f"\n\n... ({len(lines) - 50} more lines)"
                 
                 self._add_code_cell(f'''# Conflict content for {change.file_path}
-conflict_content = """{repr(change.conflict_content)}"""
+conflict_content = _BLOBS["{_blob_id(change.conflict_content)}"]
 
 # Display first 50 lines
 lines = conflict_content.splitlines()
@@ -374,38 +558,22 @@ if len(lines) > 50:
     print(f"\\n... ({{len(lines) - 50}} more lines)")
 ''')
         else:
-            # For non-conflicts, create a simple comparison
-            self._add_markdown_cell("Change Preview\n")
+            # For non-conflicts, show the diff computed at generation time
+            total, diff_lines = _unified_diff(change.content_before or '', change.content_after or '')
             
-            # Add a code cell that will show the differences
-            self._add_code_cell(f'''#Simple diff for {change.file_path}
-import difflib
-
-content_before = {repr(change.content_before or '')}
-content_after = {repr(change.content_after or '')}
-
-# Create unified diff
-content_before = content_before.replace(f"\\r\\n", f"\\n").replace(f"\\r", f"\\n")
-content_after = content_after.replace(f"\\r\\n", f"\\n").replace(f"\\r", f"\\n")
-lines_before = content_before.splitlines(keepends=True)
-lines_after = content_after.splitlines(keepends=True)
-
-diff = difflib.unified_diff(
-    lines_before,
-    lines_after,
-    fromfile='Before',
-    tofile='After',
-    n=3  # Context lines
-)
-
-# Display diff (first 100 lines)
-diff_lines = list(diff)
-for i, line in enumerate(diff_lines[:100]):
-    print(f"  {{line.rstrip()}}")
-
-if len(diff_lines) > 100:
-    print(f"\\n... ({{len(diff_lines) - 100}} more lines)")
-''')
+            preview = ["Change Preview\n\n"]
+            if change.detailed_analysis.get('skipped'):
+                preview.append("*Not shown, analysis was skipped*\n")
+            elif diff_lines:
+                diff_text = '\n'.join(diff_lines)
+                fence = _code_fence(diff_text)
+                preview.append(f"{fence}diff\n{diff_text}\n{fence}\n")
+                if total > len(diff_lines):
+                    preview.append(f"\n... ({total - len(diff_lines)} more lines)\n")
+            else:
+                preview.append("*No textual differences*\n")
+            
+            self._add_markdown_cell("".join(preview))
         
         self._add_markdown_cell("---")  # Separator between files
     
@@ -0,0 +1,57 @@
+"""Shared fixtures for the test suite."""
+
+import copy
+from dataclasses import replace
+from types import MappingProxyType
+
+import pytest
+from git_branch_comparison.models import FileChange, BranchComparison
+
+_BASE_FC = MappingProxyType({
+    "file_path": "test.py",
+    "file_type": ".py",
+    "analyzer_used": "BaseAnalyzer",
+    "has_semantic_changes": True,
+    "has_conflicts": False,
+})
+
+_BASE_BC = MappingProxyType({
+    "from_branch": "feature",
+    "to_branch": "main",
+    "temp_branch": "feature-to-main",
+    "status": "success",
+})
+
+
+@pytest.fixture(scope="session")
+def canonical_change():
+    """FileChange built once per session; treat as read-only."""
+    return FileChange(**_BASE_FC)
+
+
+@pytest.fixture(scope="session")
+def sample_changes(canonical_change):
+    """Two sample changes derived from the canonical one, as a tuple so the
+    shared cache cannot be appended to by accident."""
+    return (
+        replace(canonical_change, file_path="file1.py"),
+        replace(
+            canonical_change,
+            file_path="file2.xml",
+            file_type=".xml",
+            analyzer_used="XMLAnalyzer",
+            has_semantic_changes=False
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def canonical_comparison():
+    """BranchComparison built once per session; treat as read-only."""
+    return BranchComparison(**_BASE_BC)
+
+
+@pytest.fixture
+def fresh_comparison(canonical_comparison):
+    """Shallow copy of the canonical BranchComparison for tests that set fields."""
+    return copy.copy(canonical_comparison)
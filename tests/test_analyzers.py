@@ -1,6 +1,11 @@
 """Tests for analyzers module."""
 
+from types import SimpleNamespace
+from xml.etree import ElementTree
+from xml.parsers.expat import ExpatError
+
 import pytest
+from git_branch_comparison import analyzers
 from git_branch_comparison.analyzers import FileAnalyzerFactory, BaseAnalyzer, XMLAnalyzer, YAMLAnalyzer, PropertiesAnalyzer
 from git_branch_comparison.models import FileChange
 
@@ -40,6 +45,12 @@ def test_analyzer_factory_properties():
     assert analyzer_props.__class__.__name__ == "PropertiesAnalyzer"
 
 
+def test_analyzer_factory_reuses_instances():
+    """Test FileAnalyzerFactory shares one analyzer instance per class."""
+    assert FileAnalyzerFactory.get_analyzer("a.yml") is FileAnalyzerFactory.get_analyzer("b.yaml")
+    assert FileAnalyzerFactory.get_analyzer("a.txt") is FileAnalyzerFactory.get_analyzer("b")
+
+
 def test_analyzer_factory_case_insensitive():
     """Test FileAnalyzerFactory handles case insensitive extensions."""
     analyzer_xml = FileAnalyzerFactory.get_analyzer("test.XML")
@@ -59,6 +70,113 @@ def test_xml_analyzer_element_signature():
     assert hasattr(analyzer, '_element_signature')
 
 
+@pytest.fixture(params=["lxml", "stdlib"])
+def xml_backend(request, monkeypatch):
+    """Run a test against both XML parser backends"""
+    if request.param == "stdlib":
+        monkeypatch.setattr(analyzers, "_HAS_LXML", False)
+        monkeypatch.setattr(analyzers, "ET", ElementTree)
+        monkeypatch.setattr(analyzers, "_XML_PARSE_ERRORS", (ElementTree.ParseError, ExpatError))
+    elif not analyzers._HAS_LXML:
+        pytest.skip("lxml 5 is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("before,after,expected", [
+    pytest.param(
+        '<r><a x="1" y="2">t</a></r>',
+        '<r><a y="2" x="1">t</a></r>',
+        {'attributes_reordered': 1},
+        id="attribute_reorder",
+    ),
+    pytest.param(
+        '<r><a x="1">t</a></r>',
+        '<r><a x="2">t</a></r>',
+        {'elements_added': 1, 'elements_removed': 1},
+        id="attribute_value_change",
+    ),
+    pytest.param(
+        '<r><a>t</a></r>',
+        '<r><a>t</a><b/></r>',
+        {'elements_added': 1},
+        id="element_added",
+    ),
+    pytest.param(
+        '<r><a>t</a><b/></r>',
+        '<r><a>t</a></r>',
+        {'elements_removed': 1},
+        id="element_removed",
+    ),
+    pytest.param(
+        '<r><a>t</a></r>',
+        '<r><a>u</a></r>',
+        {'text_changes': 1},
+        id="text_change",
+    ),
+    pytest.param(
+        '<r><i>1</i><i>2</i></r>',
+        '<r><i>2</i><i>1</i></r>',
+        {'text_changes': 1},
+        id="signature_collision",
+    ),
+    pytest.param(
+        '<r>\n  <a>t</a>\n</r>',
+        '<r><a>t</a></r>',
+        {},
+        id="formatting_only",
+    ),
+])
+def test_xml_analyzer_compare_structure(xml_backend, before, after, expected):
+    """Test XMLAnalyzer structural statistics for typical edits."""
+    analyzer = XMLAnalyzer()
+    
+    stats = analyzer._compare_xml_structure(before, after)
+    
+    assert {key: value for key, value in stats.items() if value} == expected
+
+
+def test_xml_analyzer_collect_elements_last_duplicate_wins(xml_backend):
+    """Test colliding signatures keep the element last in document order."""
+    analyzer = XMLAnalyzer()
+    
+    elements = analyzer._collect_elements('<r><a>outer<a k="v">x</a><a>inner</a></a><b/></r>')
+    
+    assert elements[('a', ())] == ((), {}, 'inner')
+    assert elements[('a', (('k', 'v'),))] == (('k',), {'k': 'v'}, 'x')
+    assert set(elements) == {('r', ()), ('a', ()), ('a', (('k', 'v'),)), ('b', ())}
+
+
+def test_xml_analyzer_parse_error(xml_backend):
+    """Test XMLAnalyzer records a parse error instead of failing."""
+    analyzer = XMLAnalyzer()
+    change = FileChange(
+        file_path="broken.xml",
+        file_type=".xml",
+        analyzer_used="XMLAnalyzer",
+        has_semantic_changes=True,
+        has_conflicts=False,
+        content_before='<r><a>t</a></r>',
+        content_after='<r><a>t</r>'
+    )
+    
+    analyzer._format_specific_analysis(change)
+    
+    assert 'parse_error' in change.format_specific
+    assert change.has_semantic_changes
+
+
+def test_xml_analyzer_internal_entity_change(xml_backend):
+    """Test XMLAnalyzer sees text changes made through an internal DTD entity."""
+    analyzer = XMLAnalyzer()
+    
+    before = '<!DOCTYPE r [<!ENTITY e "v">]><r><a>&e;</a></r>'
+    after = '<!DOCTYPE r [<!ENTITY e "w">]><r><a>&e;</a></r>'
+    
+    stats = analyzer._compare_xml_structure(before, after)
+    
+    assert stats['text_changes'] == 1
+
+
 def test_yaml_analyzer_structures_equal():
     """Test YAMLAnalyzer structure comparison."""
     analyzer = YAMLAnalyzer()
@@ -72,6 +190,10 @@ def test_yaml_analyzer_structures_equal():
     assert not analyzer._yaml_structures_equal({'a': 1}, {'a': 2})
     assert not analyzer._yaml_structures_equal([1, 2], [1, 2, 3])
     assert not analyzer._yaml_structures_equal("hello", "world")
+    
+    # Test type strictness, which plain == does not provide
+    assert not analyzer._yaml_structures_equal({'a': 1}, {'a': True})
+    assert not analyzer._yaml_structures_equal([1], [1.0])
 
 
 def test_properties_analyzer_parse():
@@ -100,6 +222,17 @@ key4=value4
     assert props['key4'] == 'value4'
 
 
+def test_properties_analyzer_parse_continuation():
+    """Test PropertiesAnalyzer joins values continued with a backslash."""
+    analyzer = PropertiesAnalyzer()
+    
+    content = "key1 = first \\\n    second\\\n    third\nkey2 = value2\n"
+    
+    props = analyzer._parse_properties(content)
+    
+    assert props == {'key1': 'first secondthird', 'key2': 'value2'}
+
+
 def test_properties_analyzer_compare():
     """Test PropertiesAnalyzer comparison functionality."""
     analyzer = PropertiesAnalyzer()
@@ -114,6 +247,59 @@ def test_properties_analyzer_compare():
     assert stats['value_changes'] == 0
 
 
+def test_base_analyzer_parse_conflicts():
+    """Test BaseAnalyzer conflict marker parsing, including an empty side."""
+    analyzer = BaseAnalyzer()
+    
+    content = (
+        "<<<<<<< HEAD\nours\n=======\ntheirs\n>>>>>>> dev\n"
+        "shared\n"
+        "<<<<<<< HEAD\n=======\nadded\n>>>>>>> dev\n"
+    )
+    
+    conflicts = analyzer._parse_conflicts(content)
+    
+    assert [(c['ours'], c['theirs']) for c in conflicts] == [('ours', 'theirs'), ('', 'added')]
+    assert content[conflicts[0]['start_pos']:conflicts[0]['end_pos']].endswith(">>>>>>> dev\n")
+    assert conflicts[1]['end_pos'] == len(content)
+
+
+@pytest.mark.parametrize("before,after,expected", [
+    pytest.param("", "a\nb\nc\n", {'additions': 3, 'deletions': 0, 'total_changes': 3}, id="added_file"),
+    pytest.param("a\nb\n", "", {'additions': 0, 'deletions': 2, 'total_changes': 2}, id="emptied_file"),
+    pytest.param("a\nb\n", "a\nc\nd\n", {'additions': 2, 'deletions': 1, 'total_changes': 3}, id="edited_file"),
+])
+def test_base_analyzer_calculate_summary(before, after, expected):
+    """Test BaseAnalyzer line counts, including files added or emptied."""
+    analyzer = BaseAnalyzer()
+    change = FileChange(
+        file_path="notes.txt",
+        file_type=".txt",
+        analyzer_used="BaseAnalyzer",
+        has_semantic_changes=True,
+        has_conflicts=False,
+        content_before=before,
+        content_after=after
+    )
+    
+    analyzer._calculate_summary(change)
+    
+    assert change.summary == expected
+
+
+def test_base_analyzer_skips_binary_conflict(tmp_path):
+    """Test BaseAnalyzer neither parses nor keeps a conflicted binary file."""
+    analyzer = BaseAnalyzer()
+    (tmp_path / "image.bin").write_bytes(b"\x89PNG\0" + b"<<<<<<< HEAD\n" * 1000)
+    repo = SimpleNamespace(working_dir=str(tmp_path))
+    
+    change = analyzer.analyze_differences("image.bin", repo, merge_conflicts=True)
+    
+    assert change.has_conflicts
+    assert change.detailed_analysis == {'skipped': 'binary'}
+    assert change.conflict_content is None
+
+
 def test_base_analyzer_read_file_error_handling():
     """Test BaseAnalyzer file reading error handling."""
     analyzer = BaseAnalyzer()
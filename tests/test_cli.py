@@ -0,0 +1,51 @@
+"""Tests for cli module."""
+
+import pytest
+from git_branch_comparison.cli import load_branch_pairs
+
+
+def test_load_branch_pairs(tmp_path):
+    """Test config parsing skips comments and blanks and strips whitespace."""
+    config = tmp_path / "pairs.txt"
+    config.write_text(
+        "# Pairs to compare\n"
+        "\n"
+        "development:build\n"
+        "  feature/a : main  \n"
+        "   # indented comment\n"
+        "preprod-master\n"
+    )
+
+    pairs = load_branch_pairs(str(config))
+
+    assert pairs == [("development", "build"), ("feature/a", "main"), ("preprod", "master")]
+
+
+def test_load_branch_pairs_colon_takes_precedence(tmp_path):
+    """Test ':' separates the pair even when a branch name contains '-'."""
+    config = tmp_path / "pairs.txt"
+    config.write_text("release-1.0:hot-fix\nsome-branch-name\n")
+
+    pairs = load_branch_pairs(str(config))
+
+    assert pairs == [("release-1.0", "hot-fix"), ("some", "branch-name")]
+
+
+def test_load_branch_pairs_invalid_line(tmp_path, capsys):
+    """Test lines without a separator are reported with their line number."""
+    config = tmp_path / "pairs.txt"
+    config.write_text("development:build\n\nnoseparator\n")
+
+    pairs = load_branch_pairs(str(config))
+
+    assert pairs == [("development", "build")]
+    assert capsys.readouterr().out == "Warning: Invalid format on line 3: noseparator\n"
+
+
+def test_load_branch_pairs_missing_file(tmp_path, capsys):
+    """Test a missing config file exits with an error."""
+    with pytest.raises(SystemExit) as excinfo:
+        load_branch_pairs(str(tmp_path / "missing.txt"))
+
+    assert excinfo.value.code == 1
+    assert "Configuration file not found" in capsys.readouterr().out
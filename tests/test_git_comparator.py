@@ -0,0 +1,102 @@
+"""Tests for git_comparator module."""
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from git_branch_comparison.git_comparator import GitCatFileBatch, GitComparator
+
+
+def _git(repo_path, *args):
+    """Run a git command in the test repository"""
+    subprocess.run(['git', *args], cwd=repo_path, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    """Repository with a 'development' branch one commit ahead of 'master'"""
+    _git(tmp_path, 'init', '-q', '-b', 'master')
+    _git(tmp_path, 'config', 'user.email', 'test@example.com')
+    _git(tmp_path, 'config', 'user.name', 'Test')
+    (tmp_path / 'notes.txt').write_text('hello\n')
+    _git(tmp_path, 'add', '-A')
+    _git(tmp_path, 'commit', '-q', '-m', 'init')
+    _git(tmp_path, 'checkout', '-q', '-b', 'development')
+    (tmp_path / 'notes.txt').write_text('hello world\n')
+    _git(tmp_path, 'commit', '-q', '-am', 'change')
+    _git(tmp_path, 'checkout', '-q', 'master')
+    return tmp_path
+
+
+def test_concurrent_duplicate_pairs(repo_path):
+    """Test the same pair compared twice at once uses distinct temp branches."""
+    comparator = GitComparator(str(repo_path), no_pull=True)
+    logs = [[], []]
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            comparisons = list(executor.map(
+                lambda lines: comparator.compare_branches(
+                    'development', 'master', isolated=True, log=lines.append),
+                logs
+            ))
+    finally:
+        comparator.close()
+
+    assert [c.status for c in comparisons] == ['success', 'success']
+    assert [[ch.file_path for ch in c.changes] for c in comparisons] == [['notes.txt'], ['notes.txt']]
+    assert comparisons[0].temp_branch != comparisons[1].temp_branch
+    assert all(lines for lines in logs)
+    assert [b.name for b in comparator.repo.branches] == ['development', 'master']
+
+
+def test_cached_analysis_keeps_file_type(repo_path):
+    """Test a memoized analysis reused for another path takes that path's type."""
+    _git(repo_path, 'checkout', '-q', 'development')
+    (repo_path / 'a.yaml').write_text('key: 1\n')
+    (repo_path / 'b.yml').write_text('key: 1\n')
+    _git(repo_path, 'add', '-A')
+    _git(repo_path, 'commit', '-q', '-m', 'yaml')
+    _git(repo_path, 'checkout', '-q', 'master')
+    comparator = GitComparator(str(repo_path), no_pull=True)
+    try:
+        first, second = [
+            comparator.compare_branches('development', 'master', isolated=True, log=lambda _: None)
+            for _ in range(2)
+        ]
+    finally:
+        comparator.close()
+
+    expected = [('a.yaml', '.yaml'), ('b.yml', '.yml'), ('notes.txt', '.txt')]
+    assert [(c.file_path, c.file_type) for c in first.changes] == expected
+    assert [(c.file_path, c.file_type) for c in second.changes] == expected
+
+
+def test_cat_file_truncates_over_limit(repo_path):
+    """Test cat-file replies over the limit are cut to one byte past it."""
+    (repo_path / 'big.txt').write_bytes(b'x' * 100)
+    _git(repo_path, 'add', 'big.txt')
+    _git(repo_path, 'commit', '-q', '-m', 'big')
+    catfile = GitCatFileBatch(str(repo_path))
+    try:
+        big, small = catfile.read_many(['HEAD:big.txt', 'HEAD:notes.txt'], limit=10)
+    finally:
+        catfile.close()
+
+    assert (big, small) == (b'x' * 11, b'hello\n')
+
+
+def test_cat_file_read_replies(repo_path):
+    """Test cat-file returns blobs and None for missing and non-blob objects."""
+    catfile = GitCatFileBatch(str(repo_path))
+    try:
+        found = catfile.read('HEAD', 'notes.txt')
+        missing = catfile.read('HEAD', 'no such file')
+        missing_one_space = catfile.read('HEAD', 'my file')
+        commit = catfile.read('HEAD')
+        tree = catfile.read('HEAD^{tree}')
+        after = catfile.read('development', 'notes.txt')
+    finally:
+        catfile.close()
+
+    assert (found, missing, missing_one_space, commit, tree, after) == (
+        b'hello\n', None, None, None, None, b'hello world\n')
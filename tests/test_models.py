@@ -1,120 +1,146 @@
 """Tests for models module."""
 
+from dataclasses import asdict, replace
+
 import pytest
-from git_branch_comparison.models import FileChange, BranchComparison
-
-
-def test_file_change_creation():
-    """Test FileChange model creation."""
-    change = FileChange(
-        file_path="test.py",
-        file_type=".py",
-        analyzer_used="BaseAnalyzer",
-        has_semantic_changes=True,
-        has_conflicts=False
-    )
-    
-    assert change.file_path == "test.py"
-    assert change.file_type == ".py"
-    assert change.analyzer_used == "BaseAnalyzer"
-    assert change.has_semantic_changes is True
-    assert change.has_conflicts is False
-    assert change.summary == {}
-    assert change.detailed_analysis == {}
-    assert change.format_specific == {}
-
-
-def test_file_change_with_content():
-    """Test FileChange with content."""
-    change = FileChange(
-        file_path="example.txt",
-        file_type=".txt",
-        analyzer_used="BaseAnalyzer",
-        has_semantic_changes=True,
-        has_conflicts=False,
-        content_before="old content",
-        content_after="new content"
-    )
-    
-    assert change.content_before == "old content"
-    assert change.content_after == "new content"
-    assert change.conflict_content is None
-    assert change.error_message is None
-
-
-def test_file_change_with_conflicts():
-    """Test FileChange with conflicts."""
-    change = FileChange(
-        file_path="conflict.txt",
-        file_type=".txt",
-        analyzer_used="BaseAnalyzer",
-        has_semantic_changes=True,
-        has_conflicts=True,
-        conflict_content="<<<<<<< HEAD\nour content\n=======\ntheir content\n>>>>>>> branch"
-    )
-    
-    assert change.has_conflicts is True
-    assert change.conflict_content is not None
-    assert "<<<<<<< HEAD" in change.conflict_content
-
-
-def test_branch_comparison_creation():
-    """Test BranchComparison model creation."""
-    comparison = BranchComparison(
-        from_branch="feature",
-        to_branch="main",
-        temp_branch="feature-to-main",
-        status="success"
-    )
-    
-    assert comparison.from_branch == "feature"
-    assert comparison.to_branch == "main"
-    assert comparison.temp_branch == "feature-to-main"
-    assert comparison.status == "success"
-    assert comparison.changes == []
-    assert comparison.error_message is None
-
-
-def test_branch_comparison_with_changes():
+from git_branch_comparison.models import FileChange
+
+pytestmark = [pytest.mark.models, pytest.mark.filterwarnings("error")]
+
+# Flags are checked by truthiness (`assert x` / `assert not x`); `is` is kept for None and identity.
+
+_CONFLICT_SAMPLE = "<<<<<<< HEAD\nour content\n=======\ntheir content\n>>>>>>> branch"
+assert "<<<<<<< HEAD" in _CONFLICT_SAMPLE
+
+
+@pytest.mark.parametrize("kwargs,expected", [
+    pytest.param(
+        {},
+        {
+            "file_path": "test.py",
+            "file_type": ".py",
+            "analyzer_used": "BaseAnalyzer",
+            "has_semantic_changes": True,
+            "has_conflicts": False,
+        },
+        id="creation",
+    ),
+    pytest.param(
+        {
+            "file_path": "example.txt",
+            "file_type": ".txt",
+            "content_before": "old content",
+            "content_after": "new content",
+        },
+        {
+            "content_before": "old content",
+            "content_after": "new content",
+            "conflict_content": None,
+            "error_message": None,
+        },
+        id="with_content",
+    ),
+    pytest.param(
+        {
+            "file_path": "conflict.txt",
+            "file_type": ".txt",
+            "has_conflicts": True,
+            "conflict_content": _CONFLICT_SAMPLE,
+        },
+        {
+            "has_conflicts": True,
+            "conflict_content": _CONFLICT_SAMPLE,
+        },
+        id="with_conflicts",
+    ),
+])
+def test_file_change(canonical_change, kwargs, expected):
+    """Test FileChange field storage for creation, content and conflicts."""
+    change = replace(canonical_change, **kwargs)
+
+    assert tuple(getattr(change, name) for name in expected) == tuple(expected.values())
+
+
+def test_file_change_defaults_to_empty_details(canonical_change):
+    """Test FileChange starts with empty summary and analysis mappings."""
+    change = canonical_change
+
+    assert not change.summary
+    assert not change.detailed_analysis
+    assert not change.format_specific
+
+
+def test_file_change_keeps_conflict_content(canonical_change):
+    """Test FileChange stores the conflict text it was given as-is."""
+    change = replace(canonical_change, has_conflicts=True, conflict_content=_CONFLICT_SAMPLE)
+
+    assert change.has_conflicts
+    assert change.conflict_content is _CONFLICT_SAMPLE
+
+
+def test_file_change_requires_core_fields(canonical_change):
+    """Test FileChange rejects construction without its required fields."""
+    kwargs = asdict(canonical_change)
+    del kwargs["has_conflicts"]
+
+    with pytest.raises(TypeError):
+        FileChange(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs,expected", [
+    pytest.param(
+        {},
+        {
+            "from_branch": "feature",
+            "to_branch": "main",
+            "temp_branch": "feature-to-main",
+            "status": "success",
+            "error_message": None,
+        },
+        id="creation",
+    ),
+    pytest.param(
+        {
+            "from_branch": "nonexistent",
+            "temp_branch": "nonexistent-to-main",
+            "status": "error",
+            "error_message": "Branch 'nonexistent' does not exist",
+        },
+        {
+            "status": "error",
+            "error_message": "Branch 'nonexistent' does not exist",
+        },
+        id="error_status",
+    ),
+])
+def test_branch_comparison(canonical_comparison, kwargs, expected):
+    """Test BranchComparison field storage for creation and errors."""
+    comparison = replace(canonical_comparison, **kwargs)
+
+    assert tuple(getattr(comparison, name) for name in expected) == tuple(expected.values())
+
+
+def test_branch_comparison_with_changes(canonical_comparison, sample_changes):
     """Test BranchComparison with changes."""
-    change1 = FileChange(
-        file_path="file1.py",
-        file_type=".py",
-        analyzer_used="BaseAnalyzer",
-        has_semantic_changes=True,
-        has_conflicts=False
-    )
-    
-    change2 = FileChange(
-        file_path="file2.xml",
-        file_type=".xml",
-        analyzer_used="XMLAnalyzer",
-        has_semantic_changes=False,
-        has_conflicts=False
-    )
-    
-    comparison = BranchComparison(
-        from_branch="feature",
-        to_branch="main",
-        temp_branch="feature-to-main",
-        status="success",
-        changes=[change1, change2]
-    )
-    
-    assert len(comparison.changes) == 2
-    assert comparison.changes[0].file_path == "file1.py"
-    assert comparison.changes[1].file_path == "file2.xml"
-
-
-def test_branch_comparison_error_status():
-    """Test BranchComparison with error status."""
-    comparison = BranchComparison(
-        from_branch="nonexistent",
-        to_branch="main",
-        temp_branch="nonexistent-to-main",
-        status="error",
-        error_message="Branch 'nonexistent' does not exist"
-    )
-    
-    assert comparison.status == "error"
-    assert comparison.error_message == "Branch 'nonexistent' does not exist"
\ No newline at end of file
+    comparison = replace(canonical_comparison, changes=list(sample_changes))
+
+    assert [c.file_path for c in comparison.changes] == ["file1.py", "file2.xml"]
+
+
+def test_branch_comparison_defaults_to_no_changes(canonical_comparison):
+    """Test BranchComparison starts without changes."""
+    assert not canonical_comparison.changes
+
+
+def test_branch_comparison_counts(fresh_comparison, sample_changes):
+    """Test BranchComparison tallies follow its changes."""
+    changes = [replace(sample_changes[0], has_conflicts=True), *sample_changes[1:]]
+    comparison = fresh_comparison
+    comparison.status = "conflict"
+    comparison.changes = changes
+
+    assert comparison.tallies() == (1, 1)
+
+    comparison.changes = changes[1:]
+
+    assert comparison.tallies() == (0, 0)
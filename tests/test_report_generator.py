@@ -0,0 +1,187 @@
+"""Tests for report_generator module."""
+
+import json
+import os
+
+import nbformat
+import pytest
+
+from git_branch_comparison import report_generator
+from git_branch_comparison.models import FileChange, BranchComparison
+from git_branch_comparison.report_generator import ReportGenerator
+
+
+def _notebook_cells(path):
+    """Sources of all cells of a generated notebook"""
+    with open(path, encoding='utf-8') as f:
+        notebook = json.load(f)
+    return ["".join(cell['source']) for cell in notebook['cells']]
+
+
+def _notebook_text(path):
+    """Concatenate the sources of all cells of a generated notebook"""
+    return "".join(_notebook_cells(path))
+
+
+def _comparison(changes):
+    """feature → main comparison with the given changes"""
+    return BranchComparison(
+        from_branch="feature",
+        to_branch="main",
+        temp_branch="feature-to-main",
+        status="conflict" if any(c.has_conflicts for c in changes) else "success",
+        changes=changes
+    )
+
+
+def test_report_counts_from_changes(tmp_path):
+    """Test the dashboard counts a comparison built directly by a caller."""
+    changes = [
+        FileChange(
+            file_path="file1.py",
+            file_type=".py",
+            analyzer_used="BaseAnalyzer",
+            has_semantic_changes=True,
+            has_conflicts=True
+        ),
+        FileChange(
+            file_path="file2.xml",
+            file_type=".xml",
+            analyzer_used="XMLAnalyzer",
+            has_semantic_changes=False,
+            has_conflicts=False
+        ),
+    ]
+    comparison = _comparison(changes)
+    output_path = tmp_path / "report.ipynb"
+
+    ReportGenerator().generate_report([comparison], str(output_path))
+
+    assert "| feature | main | CONFLICT | 2 | 1 | 1 | 1 |" in _notebook_text(output_path)
+
+
+def test_report_failure_keeps_existing_file(tmp_path, monkeypatch):
+    """Test a failed generation leaves the previous report untouched."""
+    output_path = tmp_path / "report.ipynb"
+    output_path.write_text("previous report")
+    monkeypatch.setattr(ReportGenerator, "_add_comparison_section",
+                        lambda self, comparison, section_num: 1 / 0)
+
+    with pytest.raises(ZeroDivisionError):
+        ReportGenerator().generate_report([_comparison([])], str(output_path))
+
+    assert output_path.read_text() == "previous report"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.ipynb"]
+
+
+def test_report_diff_preview(tmp_path):
+    """Test the change preview cuts long diffs and outgrows backtick runs."""
+    before = "```\n" + "".join(f"line {i}\n" for i in range(200))
+    after = "".join(f"line {i} changed\n" for i in range(200))
+    change = FileChange(
+        file_path="notes.txt",
+        file_type=".txt",
+        analyzer_used="BaseAnalyzer",
+        has_semantic_changes=True,
+        has_conflicts=False,
+        content_before=before,
+        content_after=after
+    )
+    output_path = tmp_path / "report.ipynb"
+
+    ReportGenerator().generate_report([_comparison([change])], str(output_path))
+
+    cells = _notebook_cells(output_path)
+    preview = next(cell for cell in cells if cell.startswith("Change Preview"))
+    fenced = preview.split("````diff\n", 1)[1].split("\n````\n", 1)[0]
+    assert fenced.splitlines()[:3] == ["--- Before", "+++ After", "@@ -1,201 +1,200 @@"]
+    assert len(fenced.splitlines()) == 100
+    assert "-```" in fenced
+    assert preview.endswith(f"... ({3 + 201 + 200 - 100} more lines)\n")
+
+
+def test_report_cross_references_identical_diffs(tmp_path):
+    """Test a second file with the same diff links to the first analysis."""
+    first = FileChange(
+        file_path="a.txt",
+        file_type=".txt",
+        analyzer_used="BaseAnalyzer",
+        has_semantic_changes=True,
+        has_conflicts=False,
+        content_before="old\n",
+        content_after="new\n"
+    )
+    second = FileChange(
+        file_path="b.txt",
+        file_type=".txt",
+        analyzer_used="BaseAnalyzer",
+        has_semantic_changes=True,
+        has_conflicts=False,
+        content_before="old\n",
+        content_after="new\n"
+    )
+    output_path = tmp_path / "report.ipynb"
+
+    ReportGenerator().generate_report([_comparison([first, second])], str(output_path))
+
+    cells = _notebook_cells(output_path)
+    headers = [cell for cell in cells if cell.startswith("[SEMANTIC]")]
+    assert headers[0].startswith("[SEMANTIC] a.txt\n\n<a id='file-1-0'></a>")
+    assert headers[1] == "[SEMANTIC] b.txt — identical diff as [a.txt in section 1](#file-1-0)"
+    previews = [cell for cell in cells if cell.startswith("Change Preview")]
+    assert len(previews) == 1
+    assert "-old\n+new" in previews[0]
+
+
+def test_report_conflict_cells_resolve_blobs(tmp_path, capsys):
+    """Test the emitted code cells look conflict contents up in _BLOBS."""
+    content = "<<<<<<< HEAD\nours\n=======\ntheirs\n>>>>>>> feature\n"
+    change = FileChange(
+        file_path="conflict.txt",
+        file_type=".txt",
+        analyzer_used="BaseAnalyzer",
+        has_semantic_changes=True,
+        has_conflicts=True,
+        conflict_content=content
+    )
+    output_path = tmp_path / "report.ipynb"
+    ReportGenerator().generate_report([_comparison([change])], str(output_path))
+    with open(output_path, encoding='utf-8') as f:
+        notebook = json.load(f)
+    code_cells = ["".join(cell['source']) for cell in notebook['cells'] if cell['cell_type'] == 'code']
+    capsys.readouterr()
+
+    namespace = {}
+    for code in code_cells:
+        exec(code, namespace)
+
+    assert len(code_cells) == 2
+    assert namespace['conflict_content'] == content
+    assert capsys.readouterr().out.splitlines()[0] == "   1: <<<<<<< HEAD"
+
+
+def test_report_survives_short_writes(tmp_path, monkeypatch):
+    """Test flushing resumes correctly after partial vectored writes."""
+    def short_writev(fd, buffers):
+        # Write at most 7 bytes, possibly splitting a buffer
+        return os.write(fd, b"".join(bytes(b) for b in buffers)[:7])
+
+    monkeypatch.setattr(os, "writev", short_writev, raising=False)
+    monkeypatch.setattr(report_generator, "_IOV_MAX", 2)
+    monkeypatch.setattr(report_generator, "WRITE_BUFFER_BYTES", 64)
+    change = FileChange(
+        file_path="notes.txt",
+        file_type=".txt",
+        analyzer_used="BaseAnalyzer",
+        has_semantic_changes=True,
+        has_conflicts=False,
+        content_before="old\n",
+        content_after="new\n"
+    )
+    output_path = tmp_path / "report.ipynb"
+
+    ReportGenerator().generate_report([_comparison([change])], str(output_path))
+
+    notebook = nbformat.read(str(output_path), as_version=4)
+    nbformat.validate(notebook)
+    assert "-old\n+new" in _notebook_text(output_path)